@@ -19,9 +19,18 @@ class Config:
     default_submission_name: str = "project_alpha"
     criteria_path: Path = Path("config") / "judging_criteria.json"
     video_transcription_model: str = "base"
+    video_whisper_compute_type: str | None = None
     video_sentiment_model: str = "distilbert-base-uncased-finetuned-sst-2-english"
+    video_sentiment_quantization: str = "fp32"
     text_embedding_model: str = "sentence-transformers/all-MiniLM-L6-v2"
+    text_embedding_onnx_path: Path | None = None
+    text_embedding_batch_size: int = 64
+    text_embedding_precision: str = "fp16"
+    text_export_onnx: bool = False
+    text_embedding_cache_dir: Path | None = Path("data") / "intermediate_outputs" / "embeddings"
+    text_response_cache_dir: Path | None = Path("data") / "intermediate_outputs" / "responses"
     text_similarity_top_k: int = 5
+    text_cpu_threads: int | None = None
     text_ai_detector_model: str = "roberta-base-openai-detector"
     text_ai_detector_context_length: int = 8192
     device_preference: str = "auto"
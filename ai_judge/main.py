@@ -11,15 +11,15 @@ from typing import Any, Dict, Sequence, Tuple
 
 from .config import Config
 from .modules.video_analyzer import VideoAnalyzer, VideoAnalysisResult
-from .modules.text_analyzer import TextAnalyzer, TextAnalysisResult
+from .modules.text_analyzer import TextAnalyzer, TextAnalysisResult, configure_faiss_threads
 from .modules.code_analyzer import CodeAnalyzer, CodeAnalysisResult
 from .scoring.scorer import Scorer
 from .scoring.criteria import JudgingCriteria
 from .scoring.reporter import ReportGenerator
 from .utils.cache import AnalysisCache
-from .utils.fingerprint import directory_fingerprint
+from .utils.fingerprint import directory_fingerprint, file_digest
 from .utils.file_helpers import ensure_directory
-from .utils.torch_helpers import resolve_device_spec
+from .utils.torch_helpers import available_cpu_count, configure_cpu_threads, resolve_device_spec
 
 
 LOGGER = logging.getLogger(__name__)
@@ -41,6 +41,12 @@ def _resolve_criteria(
     return criteria or config.load_criteria()
 
 
+def _submission_location(config: Config, name: str, submission_path: str | Path | None) -> Path:
+    if submission_path is not None:
+        return Path(submission_path).resolve()
+    return config.submission_dir(name)
+
+
 _ZIP_NOISE_NAMES = {"__MACOSX"}
 
 
@@ -66,7 +72,7 @@ def _prepare_submission_directory(
 def _extract_submission_zip(config: Config, name: str, zip_path: Path) -> Path:
     ensure_directory(config.extracted_submissions_dir)
     extract_root = config.extracted_submissions_dir
-    digest = _file_sha1(zip_path)
+    digest = file_digest(zip_path)
     destination = extract_root / f"{zip_path.stem}_{digest[:8]}"
 
     if not destination.exists():
@@ -85,19 +91,6 @@ def _cleanup_previous_extractions(root: Path, stem: str, keep: Path) -> None:
             shutil.rmtree(candidate, ignore_errors=True)
 
 
-def _file_sha1(path: Path, chunk_size: int = 65536) -> str:
-    import hashlib
-
-    digest = hashlib.sha1()
-    with path.open("rb") as handle:
-        while True:
-            chunk = handle.read(chunk_size)
-            if not chunk:
-                break
-            digest.update(chunk)
-    return digest.hexdigest()
-
-
 def _friendly_path(path: Path | str, base: Path | None = None) -> str:
     try:
         resolved = Path(path).resolve(strict=False)
@@ -175,8 +168,13 @@ def run_pipeline(
     submission_names: Sequence[str] | None = None,
     criteria: JudgingCriteria | None = None,
     criteria_path: str | Path | None = None,
+    submission_path: str | Path | None = None,
 ) -> Dict[str, Any]:
-    """Execute the judging pipeline for one or multiple submissions."""
+    """Execute the judging pipeline for one or multiple submissions.
+
+    ``submission_path`` points a single submission at a directory or zip outside
+    ``data/submissions`` (e.g. a web upload), so it need not be copied there first.
+    """
 
     if not logging.getLogger().handlers:
         logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
@@ -197,16 +195,35 @@ def run_pipeline(
     else:
         LOGGER.info("Transformer workloads using CPU execution.")
     names = _resolve_submission_names(config, submission_name, submission_names)
+    if submission_path is not None and len(names) != 1:
+        raise ValueError("submission_path can only be used with a single submission.")
     judging_criteria = _resolve_criteria(config, criteria, criteria_path)
 
     video_analyzer = VideoAnalyzer(
         transcription_model=config.video_transcription_model,
         sentiment_model=config.video_sentiment_model,
         device_spec=device_spec,
+        compute_type=config.video_whisper_compute_type,
+        sentiment_quantization=config.video_sentiment_quantization,
+        models_dir=config.base_dir / config.models_dir,
     )
     text_analyzer = TextAnalyzer(
         similarity_corpus_dir=config.similarity_corpus_dir,
         embedding_model=config.text_embedding_model,
+        onnx_model_path=config.text_embedding_onnx_path,
+        embedding_batch_size=config.text_embedding_batch_size,
+        embedding_precision=config.text_embedding_precision,
+        export_onnx=config.text_export_onnx,
+        embedding_cache_dir=(
+            config.base_dir / config.text_embedding_cache_dir
+            if config.text_embedding_cache_dir is not None
+            else None
+        ),
+        response_cache_dir=(
+            config.base_dir / config.text_response_cache_dir
+            if config.text_response_cache_dir is not None
+            else None
+        ),
         top_k=config.text_similarity_top_k,
         ai_detector_model=config.text_ai_detector_model,
         device_spec=device_spec,
@@ -224,12 +241,24 @@ def run_pipeline(
     pipeline_start = perf_counter()
     leaderboard_duration = 0.0
 
+    prepared = []
     for name in names:
-        submission_path = config.submission_dir(name)
-        submission_dir, submission_source, extracted_root = _prepare_submission_directory(
-            config, name, submission_path
-        )
-        stage_timings: Dict[str, Dict[str, Any]] = {}
+        location = _submission_location(config, name, submission_path)
+        prepared.append((name, *_prepare_submission_directory(config, name, location)))
+
+    # Video analysis runs for all submissions at once so sentiment inference is batched.
+    video_start = perf_counter()
+    video_results = video_analyzer.analyze_many([entry[1] for entry in prepared])
+    video_duration = perf_counter() - video_start
+    LOGGER.info("Stage 'video' for %d submission(s) executed in %.3fs", len(prepared), video_duration)
+    video_share = video_duration / max(1, len(prepared))
+
+    for (name, submission_dir, submission_source, extracted_root), video_result in zip(
+        prepared, video_results
+    ):
+        stage_timings: Dict[str, Dict[str, Any]] = {
+            "video": {"seconds": round(video_share, 4), "batch_size": len(prepared)},
+        }
 
         def _time_stage(stage_name: str, func):
             start = perf_counter()
@@ -241,10 +270,6 @@ def run_pipeline(
             LOGGER.info("Stage '%s' for %s executed in %.3fs", stage_name, name, duration)
             return value
 
-        video_result = _time_stage(
-            "video",
-            lambda: video_analyzer.analyze(submission_dir),
-        )
         text_result = _time_stage(
             "text",
             lambda: text_analyzer.analyze(submission_dir, video_result.transcript),
@@ -374,9 +399,21 @@ def _build_config(args: argparse.Namespace) -> Config:
     return Config(**config_kwargs)
 
 
+def configure_threads(config: Config) -> None:
+    """Size the process-wide torch and FAISS CPU thread pools; call once from an entry point.
+
+    Library defaults often over- or under-subscribe the cores actually available.
+    """
+    threads = max(1, config.text_cpu_threads or available_cpu_count())
+    if resolve_device_spec(config.device_preference).kind == "cpu":
+        configure_cpu_threads(threads)
+    configure_faiss_threads(threads)
+
+
 def main() -> None:
     args = _parse_args()
     config = _build_config(args)
+    configure_threads(config)
     criteria_path = Path(args.criteria_path).resolve() if args.criteria_path else None
     run_pipeline(
         config=config,
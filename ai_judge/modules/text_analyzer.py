@@ -1,30 +1,57 @@
 from __future__ import annotations
 
+import codecs
+import hashlib
+import heapq
+import json
 import logging
 import math
 import re
+import sys
+import threading
 import warnings
-from dataclasses import dataclass, replace
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, Mapping, Sequence, Tuple
-
-from ..utils.file_helpers import read_submission_description, read_text
+from typing import Any, Callable, Iterable, Mapping, Sequence, Tuple
+
+from ..utils import encoders
+from ..utils.cache import ResponseCache
+from ..utils.embedding_cache import CorpusEmbeddingCache
+from ..utils.encoders import (
+    OnnxEncoder,
+    OnnxSequenceClassifier,
+    SentenceTransformerEncoder,
+    TextEncoder,
+    export_onnx,
+)
+from ..utils.file_helpers import read_submission_description, read_text, read_text_prefix
 from ..utils.torch_helpers import DeviceSpec
 
 try:  # pragma: no cover - optional heavy dependencies
-    from sentence_transformers import SentenceTransformer  # type: ignore
+    import numpy as np  # type: ignore
 except ImportError:  # pragma: no cover - optional heavy dependencies
-    SentenceTransformer = None  # type: ignore
+    np = None  # type: ignore
 
 try:  # pragma: no cover - optional heavy dependencies
-    import numpy as np  # type: ignore
+    import torch  # type: ignore
+    from transformers import AutoModelForSequenceClassification, AutoTokenizer  # type: ignore
 except ImportError:  # pragma: no cover - optional heavy dependencies
-    np = None  # type: ignore
+    torch = None  # type: ignore
+    AutoModelForSequenceClassification = None  # type: ignore
+    AutoTokenizer = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    from scipy import sparse  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    sparse = None  # type: ignore
 
 try:  # pragma: no cover - optional heavy dependencies
-    from transformers import pipeline  # type: ignore
+    import faiss  # type: ignore
 except ImportError:  # pragma: no cover - optional heavy dependencies
-    pipeline = None  # type: ignore
+    faiss = None  # type: ignore
 
 try:  # pragma: no cover - optional dependency
     from ddgs import DDGS  # type: ignore
@@ -49,6 +76,67 @@ if DDGS is not None and getattr(DDGS, "__module__", "").startswith("duckduckgo_s
 
 LOGGER = logging.getLogger(__name__)
 
+_SENT_SPLIT = re.compile(r"[\.!?]\s+")
+_WORD_RE = re.compile(r"\b\w+\b")
+_PRONOUNS = frozenset({"i", "we", "our", "us", "team"})
+_NON_SPACE_RE = re.compile(r"\S+")
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9%]+")
+_CLAIM_RE = re.compile(
+    r"(?P<num>\b\d+(?:\.\d+)?%?\b)"
+    r"|(?P<absolute>guarantee|zero)"
+    r"|(?P<hype>state-of-the-art|breakthrough)"
+    r"|(?P<keyword>accuracy|perfect)",
+    re.IGNORECASE,
+)
+_HAS_CLAIM_SIGNAL_RE = re.compile(
+    r"\d+%|guarantee|perfect|state-of-the-art|breakthrough|revolutionary|never fails",
+    re.IGNORECASE,
+)
+_LIKELIHOOD_RE = re.compile(r'"likelihood":\s*([0-9.]+)')
+# Markdown/URL/boilerplate stripping applied before text is sent to Gemini.
+_MD_LEADING_HEADER_RE = re.compile(r"^#+\s*")
+_MD_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+# One alternation for every clean-up step, applied in a single left-to-right scan.
+_CLEAN_RE = re.compile(
+    r"(?P<header>#+\s*)"
+    r"|\*\*(?P<bold>[^*]+)\*\*"
+    r"|\*(?P<italic>[^*]+)\*"
+    r"|`(?P<code>[^`]+)`"
+    r"|(?P<url>https?://[^\s]+)"
+    r"|(?P<boilerplate>(?i:Clone the Repository|Getting Started|Installation|How to Run))"
+)
+_WS_RE = re.compile(r"\s+")
+_VERDICT_RE = re.compile(r"verdict\s*:\s*(plausible|needs_verification|implausible)", re.IGNORECASE)
+_REASON_RE = re.compile(r"reason\s*:\s*(.+)", re.IGNORECASE)
+_BATCH_VERDICT_RE = re.compile(
+    r"Claim\s+(\d+)\s+Verdict\s*:\s*(plausible|needs_verification|implausible)\s*\n"
+    r"\s*Claim\s+\1\s+Reason\s*:\s*(.+)",
+    re.IGNORECASE,
+)
+
+
+def _non_ascii_to_space(exc: UnicodeError) -> tuple[str, int]:
+    # The ASCII codec reports each run of unencodable characters as one error.
+    return " ", exc.end
+
+
+_ASCII_SPACE_ERRORS = "ai_judge.non_ascii_to_space"
+codecs.register_error(_ASCII_SPACE_ERRORS, _non_ascii_to_space)
+
+
+def _clean_replacement(match: re.Match[str]) -> str:
+    kind = match.lastgroup
+    if kind in ("bold", "italic", "code"):
+        # Markup may be nested (e.g. bold inside code), so clean the inner text too.
+        return _CLEAN_RE.sub(_clean_replacement, match.group(kind))
+    return ""
+
+
+def configure_faiss_threads(num_threads: int) -> None:
+    """Set FAISS's process-wide OpenMP thread count, if FAISS is installed."""
+    if faiss is not None:
+        faiss.omp_set_num_threads(max(1, num_threads))
+
 
 @dataclass(frozen=True)
 class SimilarityMatch:
@@ -172,6 +260,38 @@ class ClaimFlag:
         )
 
 
+@dataclass(frozen=True)
+class _DescStats:
+    """Tokenization of a description shared by the heuristics in ``analyze``."""
+
+    text: str
+    tokens: tuple[str, ...]
+    lower_set: frozenset[str]
+    # \w+ word counts for the AI-likelihood heuristic (lowercased).
+    word_total: int
+    unique_words: int
+    pronoun_hits: int
+
+    @classmethod
+    def from_text(cls, description: str) -> "_DescStats":
+        text = description.strip()
+        tokens = tuple(text.split())
+        # Lowercase once up front so both the scan and the counting stay in C.
+        counts = Counter(_WORD_RE.findall(text.lower()))
+        return cls(
+            text=text,
+            tokens=tokens,
+            lower_set=frozenset(token.lower() for token in tokens),
+            word_total=sum(counts.values()),
+            unique_words=len(counts),
+            pronoun_hits=sum(counts[word] for word in _PRONOUNS),
+        )
+
+    @property
+    def word_count(self) -> int:
+        return len(self.tokens)
+
+
 @dataclass(frozen=True)
 class TextAnalysisResult:
     """Results of analyzing the written project description."""
@@ -221,6 +341,37 @@ class TextAnalysisResult:
 class TextAnalyzer:
     """Hybrid text analyzer blending heuristics with optional ML models."""
 
+    # Corpora larger than this are searched through a FAISS inner-product index.
+    _FAISS_MIN_CORPUS = 256
+    # Beyond this size an approximate IVF-PQ index replaces exact flat search.
+    _FAISS_IVF_MIN_CORPUS = 10_000
+    _FAISS_IVF_FACTORY = "IVF100,PQ8"
+    _FAISS_IVF_NPROBE = 10
+    # Between these sizes vectors are stored as 8-bit scalar codes (exact scan, 4x smaller).
+    _FAISS_SQ8_MIN_CORPUS = 1_000
+    # The AI-likelihood heuristic needs a few words before its ratios mean anything.
+    _AI_HEURISTIC_MIN_TOKENS = 5
+    _AI_HEURISTIC_PRIOR = 0.3
+    # Local detector scores inside this band are too uncertain to skip Gemini.
+    _AI_DETECTOR_UNCERTAIN = (0.2, 0.8)
+    # Evidence searches run in parallel, but only a couple may hit DuckDuckGo at once.
+    _EVIDENCE_WORKERS = 4
+    _DDG_CONCURRENCY = 2
+    # Heavy models and API clients are shared by every analyzer with the same settings.
+    _SHARED_LOCK = threading.Lock()
+    _GEMINI_CLIENTS: dict[tuple[str, str], Any] = {}
+    _EMBEDDERS: dict[tuple[Any, ...], TextEncoder] = {}
+    _AI_DETECTORS: dict[tuple[Any, ...], Callable[[str], list[tuple[str, float]]]] = {}
+    # Below these sizes the AI-detection and summary prompts are skipped.
+    _GEMINI_MIN_CHARS = 200
+    _GEMINI_MIN_UNIQUE_WORDS = 20
+    _GEMINI_SAFETY_SETTINGS = [
+        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+    ]
+
     def __init__(
         self,
         similarity_corpus_dir: Path | None = None,
@@ -231,15 +382,39 @@ class TextAnalyzer:
         device_spec: DeviceSpec | None = None,
         gemini_api_key: str | None = None,
         gemini_model: str = "models/gemini-2.0-flash-lite",
+        onnx_model_path: Path | None = None,
+        embedding_batch_size: int = 64,
+        embedding_cache_dir: Path | None = None,
+        response_cache_dir: Path | None = None,
+        embedding_precision: str = "fp16",
+        export_onnx: bool = False,
+        max_corpus_bytes: int | None = 16 * 1024,
     ) -> None:
         self.similarity_corpus_dir = Path(similarity_corpus_dir) if similarity_corpus_dir else None
         self._embedding_model_name = embedding_model
+        self._onnx_model_path = Path(onnx_model_path) if onnx_model_path else None
         self._ai_detector_model = ai_detector_model
         self._top_k = top_k
-
-        self._embedder = None
-        self._ai_detector = None
-        self._corpus_cache: list[tuple[str, str]] | None = None
+        self._embedding_batch_size = max(1, embedding_batch_size)
+        self._embedding_precision = embedding_precision
+        self._export_onnx = export_onnx
+        # Encoders truncate far below this, so reading further only costs I/O and tokens.
+        # Lexical (Jaccard) similarity also sees only this prefix; None reads whole files.
+        self._max_corpus_bytes = max_corpus_bytes
+        self._embedding_cache_dir = Path(embedding_cache_dir) if embedding_cache_dir else None
+        self._response_cache = ResponseCache(response_cache_dir) if response_cache_dir else None
+        self._ddg_slots = threading.BoundedSemaphore(self._DDG_CONCURRENCY)
+
+        self._embedder: TextEncoder | None = None
+        self._embedding_backend: str | None = None
+        self._corpus_embeddings: Any | None = None
+        self._faiss_index: Any | None = None
+        self._lexical_index: tuple[dict[str, int], Any, Any] | None = None
+        self._ai_detector: Callable[[str], list[tuple[str, float]]] | None = None
+        self._corpus_cache: list[tuple[str, str, frozenset[str]]] | None = None
+        self._corpus_mtime_ns: int | None = None
+        self._corpus_fingerprint = ""
+        self._snippet_cache: dict[str, str] = {}
         self._device_spec = device_spec
         self._ai_detector_context_length = max(512, ai_detector_context_length)
         self._gemini_api_key = gemini_api_key
@@ -248,15 +423,20 @@ class TextAnalyzer:
 
     def analyze(self, submission_dir: Path, transcript: str = "") -> TextAnalysisResult:
         description, _ = read_submission_description(submission_dir)
-        word_count = len(description.split())
-        matches = self._compute_similarity(description)
-        originality = self._estimate_originality(description, matches)
-        feasibility = self._estimate_feasibility(word_count)
-        summary = self._summarize(description)
-        claims = self._flag_claims(description)
-        claims = self._enrich_claims_with_gemini(description, claims)
-        claims = self._verify_claims(claims)
-        ai_likelihood = self._estimate_ai_generated(description)
+        stats = _DescStats.from_text(description)
+        matches = self._compute_similarity(stats)
+        originality = self._estimate_originality(stats, matches)
+        feasibility = self._estimate_feasibility(stats.word_count)
+        summary = self._summarize(stats)
+        # Enrichment passes fill in mutable rows; each ClaimFlag is frozen exactly once.
+        claim_rows: list[dict[str, Any]] = [
+            {"statement": flag.statement, "reason": flag.reason}
+            for flag in self._flag_claims(description)
+        ]
+        self._enrich_claims_with_gemini(description, claim_rows)
+        self._verify_claims(claim_rows)
+        claims = [ClaimFlag(**row) for row in claim_rows]
+        ai_likelihood = self._estimate_ai_generated(stats)
         combined_summary = self._generate_combined_summary(description, transcript)
 
         return TextAnalysisResult(
@@ -272,13 +452,11 @@ class TextAnalyzer:
     # ------------------------------------------------------------------
     # Core heuristics
     def _estimate_originality(
-        self, description: str, matches: Iterable[SimilarityMatch] | None = None
+        self, stats: _DescStats, matches: Iterable[SimilarityMatch] | None = None
     ) -> float:
-        if not description.strip():
+        if not stats.tokens:
             return 0.0
-        tokens = description.split()
-        unique_tokens = len({token.lower() for token in tokens})
-        lexical_uniqueness = unique_tokens / len(tokens) if tokens else 0.0
+        lexical_uniqueness = len(stats.lower_set) / len(stats.tokens)
         similarity_penalty = 0.0
         if matches:
             similarity_penalty = max(match.score for match in matches) * 0.4
@@ -288,106 +466,346 @@ class TextAnalyzer:
     def _estimate_feasibility(self, word_count: int) -> float:
         if word_count == 0:
             return 0.0
-        return round(min(1.0, math.log(word_count + 1, 10)), 3)
+        return round(min(1.0, math.log10(word_count + 1)), 3)
 
-    def _summarize(self, description: str, max_words: int = 40) -> str:
-        if not description.strip():
+    def _summarize(self, stats: _DescStats, max_words: int = 40) -> str:
+        if not stats.text:
             return "No project description provided."
-        tokens = description.split()
-        if len(tokens) <= max_words:
-            return description.strip()
-        return " ".join(tokens[:max_words]) + "..."
+        if len(stats.tokens) <= max_words:
+            return stats.text
+        return " ".join(stats.tokens[:max_words]) + "..."
 
     # ------------------------------------------------------------------
     # Similarity detection
-    def _load_corpus(self) -> list[tuple[str, str]]:
-        if self._corpus_cache is not None:
+    def _load_corpus(self) -> list[tuple[str, str, frozenset[str]]]:
+        mtime_ns = self._corpus_dir_mtime_ns()
+        if self._corpus_cache is not None and mtime_ns == self._corpus_mtime_ns:
             return self._corpus_cache
-        corpus: list[tuple[str, str]] = []
-        if self.similarity_corpus_dir and self.similarity_corpus_dir.exists():
-            for path in self.similarity_corpus_dir.rglob("*.txt"):
-                text = read_text(path)
+        # Corpus changed (or first load): drop everything derived from the old one.
+        self._corpus_embeddings = None
+        self._faiss_index = None
+        self._lexical_index = None
+        self._snippet_cache.clear()
+        corpus: list[tuple[str, str, frozenset[str]]] = []
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(f"max_bytes={self._max_corpus_bytes}\n".encode("utf-8"))
+        if mtime_ns is not None:
+            for path in sorted(self.similarity_corpus_dir.rglob("*.txt")):
+                text = (
+                    read_text(path)
+                    if self._max_corpus_bytes is None
+                    else read_text_prefix(path, self._max_corpus_bytes)
+                )
                 if text.strip():
-                    corpus.append((path.stem, text))
+                    # Interned so vocabulary and set lookups can short-circuit on identity.
+                    tokens = frozenset(sys.intern(token.lower()) for token in text.split())
+                    relative = path.relative_to(self.similarity_corpus_dir)
+                    # The corpus is recursive: key by relative path so same-named files in
+                    # different folders stay distinct (top-level keys are still the stem).
+                    key = relative.with_suffix("").as_posix()
+                    corpus.append((key, text, tokens))
+                    self._snippet_cache[key] = self._snippet(text)
+                    stat = path.stat()
+                    digest.update(f"{relative}|{stat.st_mtime_ns}|{stat.st_size}\n".encode("utf-8"))
         self._corpus_cache = corpus
+        self._corpus_mtime_ns = mtime_ns
+        self._corpus_fingerprint = digest.hexdigest()
         return corpus
 
-    def _compute_similarity(self, description: str) -> list[SimilarityMatch]:
-        description = description.strip()
-        if not description:
+    def _corpus_dir_mtime_ns(self) -> int | None:
+        if self.similarity_corpus_dir is None:
+            return None
+        try:
+            return self.similarity_corpus_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _corpus_snippet(self, key: str, text: str) -> str:
+        snippet = self._snippet_cache.get(key)
+        if snippet is None:
+            snippet = self._snippet(text)
+            self._snippet_cache[key] = snippet
+        return snippet
+
+    def _build_match(self, key: str, score: float, text: str) -> SimilarityMatch:
+        return SimilarityMatch(source=key, score=round(score, 3), snippet=self._corpus_snippet(key, text))
+
+    def _top_matches(self, scored: Iterable[tuple[str, float, str]]) -> list[SimilarityMatch]:
+        """Select the top-k ``(key, score, text)`` entries and only then build snippets."""
+        ranked = heapq.nlargest(self._top_k, scored, key=lambda item: item[1])
+        return [self._build_match(key, score, text) for key, score, text in ranked]
+
+    def _ranked_matches(
+        self, corpus: Sequence[tuple[str, str, frozenset[str]]], scores: Any
+    ) -> list[SimilarityMatch]:
+        """Top-k over a dense per-document score array; matches are built for the winners only."""
+        if self._top_k <= 0:
+            return []
+        top = np.arange(len(scores))
+        if self._top_k < len(scores):
+            # k-th largest score via O(N) partition; ties at the cut keep corpus order.
+            cutoff = -np.partition(-scores, self._top_k - 1)[self._top_k - 1]
+            above = np.flatnonzero(scores > cutoff)
+            tied = np.flatnonzero(scores == cutoff)[: self._top_k - len(above)]
+            top = np.sort(np.concatenate([above, tied]))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            self._build_match(corpus[idx][0], float(scores[idx]), corpus[idx][1]) for idx in top
+        ]
+
+    def _compute_similarity(self, stats: _DescStats) -> list[SimilarityMatch]:
+        if not stats.text:
             return []
         corpus = self._load_corpus()
         if not corpus:
             return []
 
-        if SentenceTransformer and self._embedding_model_name:
-            return self._embedding_similarity(description, corpus)
+        if self._embedding_model_name and self._embedding_backend_available():
+            return self._embedding_similarity(stats, corpus)
+
+        return self._lexical_similarity(stats.lower_set, corpus)
+
+    def _embedding_backend_available(self) -> bool:
+        if np is None:
+            return False
+        if self._onnx_model_path is not None:
+            return encoders.ort is not None and encoders.AutoTokenizer is not None
+        if self._export_onnx and encoders.onnx_export_available():
+            return True
+        return encoders.SentenceTransformer is not None
+
+    def _onnx_artifact(
+        self, role: str, model_name: str, sequence_classification: bool = False
+    ) -> Path | None:
+        """Exported ONNX graph for ``model_name`` under the cache dir, created on first use."""
+        if not (self._export_onnx and self._embedding_cache_dir and encoders.onnx_export_available()):
+            return None
+        slug = hashlib.blake2b(model_name.encode("utf-8"), digest_size=8).hexdigest()
+        path = self._embedding_cache_dir / "onnx" / slug / f"{role}.onnx"
+        try:  # pragma: no cover - depends on optional libs
+            return export_onnx(model_name, path, sequence_classification=sequence_classification)
+        except Exception as exc:  # pragma: no cover - depends on optional libs
+            LOGGER.warning("ONNX export of %s failed, using PyTorch: %s", model_name, exc)
+            return None
+
+    def _get_embedder(self) -> TextEncoder:  # pragma: no cover - depends on optional libs
+        if self._embedder is None:
+            onnx_path = self._onnx_model_path or self._onnx_artifact(
+                "embedder", self._embedding_model_name
+            )
+            device = (
+                self._device_spec.sentence_transformer_device
+                if self._device_spec is not None
+                else None
+            )
+            key = (
+                self._embedding_model_name,
+                str(onnx_path) if onnx_path is not None else None,
+                device,
+                self._embedding_batch_size,
+                self._embedding_precision,
+            )
+            with self._SHARED_LOCK:
+                embedder = self._EMBEDDERS.get(key)
+                if embedder is None:
+                    if onnx_path is not None:
+                        embedder = OnnxEncoder(
+                            onnx_path,
+                            self._embedding_model_name,
+                            batch_size=self._embedding_batch_size,
+                        )
+                    else:
+                        embedder = SentenceTransformerEncoder(
+                            self._embedding_model_name,
+                            device=device,
+                            batch_size=self._embedding_batch_size,
+                            precision=self._embedding_precision,
+                        )
+                    self._EMBEDDERS[key] = embedder
+            self._embedder = embedder
+            self._embedding_backend = (
+                f"onnx:{onnx_path}" if onnx_path is not None else f"st:{self._embedding_precision}"
+            )
+        return self._embedder
+
+    def _corpus_matrix(
+        self, corpus: Sequence[tuple[str, str, frozenset[str]]], embedder: TextEncoder
+    ) -> Any:
+        """Encode the static corpus once and keep it as a contiguous ``(N, d)`` matrix.
+
+        Rows are stored as float16 to halve the resident size; callers upcast for scoring.
+        With ``embedding_cache_dir`` set, the matrix and FAISS index are reused across runs.
+        """
+        if self._corpus_embeddings is not None:
+            return self._corpus_embeddings
+        store = self._embedding_store()
+        cached = store.load(self._corpus_fingerprint) if store is not None else None
+        if cached is not None and len(cached[0]) == len(corpus):
+            self._corpus_embeddings, self._faiss_index = cached
+            if self._faiss_index is None and faiss is not None and len(corpus) > self._FAISS_MIN_CORPUS:
+                self._faiss_index = self._build_faiss_index(
+                    np.ascontiguousarray(self._corpus_embeddings, dtype=np.float32)
+                )
+            return self._corpus_embeddings
+
+        vectors = np.ascontiguousarray(
+            embedder.encode([text for _, text, _ in corpus]), dtype=np.float32
+        )
+        if faiss is not None and len(corpus) > self._FAISS_MIN_CORPUS:
+            self._faiss_index = self._build_faiss_index(vectors)
+        self._corpus_embeddings = vectors.astype(np.float16)
+        if store is not None:
+            try:
+                store.store(self._corpus_fingerprint, self._corpus_embeddings, self._faiss_index)
+            except OSError as exc:
+                LOGGER.warning("Could not persist corpus embeddings: %s", exc)
+        return self._corpus_embeddings
 
-        return self._lexical_similarity(description, corpus)
+    def _embedding_store(self) -> CorpusEmbeddingCache | None:
+        if self._embedding_cache_dir is None:
+            return None
+        # Backends embed differently (the ONNX encoder always mean-pools), so the cached
+        # corpus matrix is keyed on the one that actually encodes queries.
+        backend = self._embedding_backend or f"st:{self._embedding_precision}"
+        model_key = f"{self._embedding_model_name}|{backend}"
+        return CorpusEmbeddingCache(self._embedding_cache_dir, model_key)
+
+    def _build_faiss_index(self, vectors: Any) -> Any:
+        """Inner-product index sized to the corpus: flat, 8-bit scalar-quantized, or IVF-PQ."""
+        dim = vectors.shape[1]
+        if len(vectors) > self._FAISS_IVF_MIN_CORPUS:
+            try:
+                index = faiss.index_factory(dim, self._FAISS_IVF_FACTORY, faiss.METRIC_INNER_PRODUCT)
+                index.train(vectors)
+                index.add(vectors)
+                index.nprobe = self._FAISS_IVF_NPROBE
+                return index
+            except Exception as exc:  # pragma: no cover - depends on faiss build
+                LOGGER.debug("IVF-PQ index unavailable, using exact search: %s", exc)
+        elif len(vectors) >= self._FAISS_SQ8_MIN_CORPUS:
+            try:
+                index = faiss.IndexScalarQuantizer(
+                    dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+                )
+                index.train(vectors)
+                index.add(vectors)
+                return index
+            except Exception as exc:  # pragma: no cover - depends on faiss build
+                LOGGER.debug("Scalar-quantized index unavailable, using exact search: %s", exc)
+        index = faiss.IndexFlatIP(dim)
+        index.add(vectors)
+        return index
 
     def _embedding_similarity(
-        self, description: str, corpus: Iterable[tuple[str, str]]
-    ) -> list[SimilarityMatch]:  # pragma: no cover - depends on optional libs
+        self, stats: _DescStats, corpus: Sequence[tuple[str, str, frozenset[str]]]
+    ) -> list[SimilarityMatch]:
         try:
-            if self._embedder is None:
-                device_kwargs: dict[str, object] = {}
-                if self._device_spec is not None:
-                    device_kwargs["device"] = self._device_spec.sentence_transformer_device
-                self._embedder = SentenceTransformer(self._embedding_model_name, **device_kwargs)
-            query_vec = self._embedder.encode(description, normalize_embeddings=True)
-            matches: list[SimilarityMatch] = []
-            for key, text in corpus:
-                corpus_vec = self._embedder.encode(text, normalize_embeddings=True)
-                if np is not None:
-                    score = float(np.clip(np.dot(query_vec, corpus_vec), -1.0, 1.0))
-                else:
-                    score = float(sum(a * b for a, b in zip(query_vec, corpus_vec)))
-                snippet = self._snippet(text)
-                matches.append(SimilarityMatch(source=key, score=round(score, 3), snippet=snippet))
-            matches.sort(key=lambda item: item.score, reverse=True)
-            return matches[: self._top_k]
-        except Exception:
-            return self._lexical_similarity(description, corpus)
-
-    def _lexical_similarity(self, description: str, corpus: Iterable[tuple[str, str]]) -> list[SimilarityMatch]:
-        query_tokens = set(token.lower() for token in description.split())
-        matches: list[SimilarityMatch] = []
+            embedder = self._get_embedder()
+            matrix = self._corpus_matrix(corpus, embedder)
+            query_vec = np.asarray(embedder.encode([stats.text])[0], dtype=np.float32)
+            if self._faiss_index is not None:
+                scores, indices = self._faiss_index.search(
+                    query_vec[None, :], min(self._top_k, len(corpus))
+                )
+                # FAISS already returns hits best-first.
+                return [
+                    self._build_match(corpus[idx][0], float(np.clip(score, -1.0, 1.0)), corpus[idx][1])
+                    for score, idx in zip(scores[0], indices[0])
+                    if idx >= 0
+                ]
+            scores = np.clip(matrix.astype(np.float32) @ query_vec, -1.0, 1.0)
+            return self._ranked_matches(corpus, scores)
+        except Exception as exc:
+            LOGGER.debug("Embedding similarity failed, using lexical fallback: %s", exc)
+            return self._lexical_similarity(stats.lower_set, corpus)
+
+    def _lexical_matrix(
+        self, corpus: Sequence[tuple[str, str, frozenset[str]]]
+    ) -> tuple[dict[str, int], Any, Any]:
+        """Binary ``(N, V)`` token-incidence structure over the corpus vocabulary.
+
+        A scipy CSR matrix when scipy is installed, otherwise the equivalent
+        ``(doc_ids, token_ids)`` coordinate arrays for a NumPy ``bincount`` kernel.
+        """
+        if self._lexical_index is None:
+            vocab: dict[str, int] = {}
+            indptr = [0]
+            indices: list[int] = []
+            for _, _, tokens in corpus:
+                indices.extend(vocab.setdefault(token, len(vocab)) for token in tokens)
+                indptr.append(len(indices))
+            counts = np.diff(np.asarray(indptr, dtype=np.int64))
+            if sparse is not None:
+                incidence: Any = sparse.csr_matrix(
+                    (np.ones(len(indices), dtype=np.float64), indices, indptr),
+                    shape=(len(corpus), max(1, len(vocab))),
+                )
+            else:
+                doc_ids = np.repeat(np.arange(len(corpus), dtype=np.int32), counts)
+                incidence = (doc_ids, np.asarray(indices, dtype=np.int32))
+            self._lexical_index = (vocab, incidence, counts.astype(np.float64))
+        return self._lexical_index
+
+    def _lexical_similarity(
+        self, query_tokens: frozenset[str], corpus: Sequence[tuple[str, str, frozenset[str]]]
+    ) -> list[SimilarityMatch]:
         if not query_tokens:
-            return matches
-        for key, text in corpus:
-            tokens = set(token.lower() for token in text.split())
+            return []
+        if np is not None and corpus:
+            # Jaccard for every document at once: |A∩B| is the incidence matrix times
+            # the query indicator vector.
+            vocab, incidence, sizes = self._lexical_matrix(corpus)
+            query = np.zeros(max(1, len(vocab)), dtype=np.float64)
+            query[[vocab[token] for token in query_tokens if token in vocab]] = 1.0
+            if sparse is not None:
+                intersection = incidence @ query
+            else:
+                doc_ids, token_ids = incidence
+                intersection = np.bincount(doc_ids, weights=query[token_ids], minlength=len(corpus))
+            union = sizes + len(query_tokens) - intersection
+            scores = np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+            return self._ranked_matches(corpus, scores)
+        scored: list[tuple[str, float, str]] = []
+        for key, text, tokens in corpus:
             intersection = len(query_tokens & tokens)
             union = len(query_tokens | tokens)
             score = intersection / union if union else 0.0
-            matches.append(
-                SimilarityMatch(source=key, score=round(score, 3), snippet=self._snippet(text))
-            )
-        matches.sort(key=lambda item: item.score, reverse=True)
-        return matches[: self._top_k]
+            scored.append((key, score, text))
+        return self._top_matches(scored)
 
     # ------------------------------------------------------------------
     # Claim verification
-    def _verify_claims(self, claims: Sequence[ClaimFlag]) -> Tuple[ClaimFlag, ...]:
+    def _verify_claims(self, claims: Sequence[dict[str, Any]]) -> None:
+        """Attach web-evidence verification results to each claim row in place."""
         if not claims:
-            return tuple()
-
-        verified: list[ClaimFlag] = []
-        for claim in claims:
-            evidence = self._search_evidence(claim.statement)
-            verification_result = self._derive_verification_result(claim.statement, evidence)
-            verified.append(replace(claim, verification_result=verification_result))
-        return tuple(verified)
+            return
+        statements = [claim["statement"] for claim in claims]
+        if len(statements) == 1 or DDGS is None:
+            evidences = [self._search_evidence(statement) for statement in statements]
+        else:
+            workers = min(self._EVIDENCE_WORKERS, len(statements))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                evidences = list(executor.map(self._search_evidence, statements))
+        for claim, statement, evidence in zip(claims, statements, evidences):
+            claim["verification_result"] = self._derive_verification_result(statement, evidence)
 
     def _search_evidence(self, query: str, max_results: int = 3) -> list[Mapping[str, Any]]:
         if DDGS is None:
             return []
+        key = ResponseCache.key("ddg", query, max_results)
+        if self._response_cache is not None:
+            cached = self._response_cache.get("ddg", key)
+            if isinstance(cached, list):
+                return cached
         try:  # pragma: no cover - network dependent
-            with DDGS() as ddgs:
-                results = ddgs.text(query, max_results=max_results)
-                return list(results)
+            with self._ddg_slots, DDGS() as ddgs:
+                results = list(ddgs.text(query, max_results=max_results) or [])
         except Exception as exc:  # pragma: no cover
             LOGGER.debug("Claim verification search failed: %s", exc)
             return []
+        if self._response_cache is not None:
+            self._response_cache.set("ddg", key, results)
+        return results
 
     def _derive_verification_result(
         self, statement: str, evidence: Iterable[Mapping[str, Any]]
@@ -395,7 +813,7 @@ class TextAnalyzer:
         normalized_evidence: list[Mapping[str, str]] = []
         statement_tokens = {
             token
-            for token in re.findall(r"[a-zA-Z0-9%]+", statement.lower())
+            for token in _TOKEN_RE.findall(statement.lower())
             if len(token) > 3
         }
         support_hits = 0
@@ -409,11 +827,8 @@ class TextAnalyzer:
             ).strip()
             if not snippet:
                 continue
-            haystack_tokens = set(re.findall(r"[a-zA-Z0-9%]+", snippet.lower()))
-            if statement_tokens:
-                overlap = len(statement_tokens & haystack_tokens) / len(statement_tokens)
-                if overlap >= 0.25:
-                    support_hits += 1
+            if statement_tokens and self._supports_statement(statement_tokens, snippet):
+                support_hits += 1
             normalized_evidence.append(
                 {
                     "title": str(entry.get("title", "")),
@@ -438,8 +853,29 @@ class TextAnalyzer:
             evidence=tuple(normalized_evidence[:3]),
         )
 
+    @staticmethod
+    def _supports_statement(statement_tokens: set[str], snippet: str, threshold: float = 0.25) -> bool:
+        """True once at least ``threshold`` of the statement tokens appear in ``snippet``."""
+        needed = math.ceil(threshold * len(statement_tokens))
+        found: set[str] = set()
+        for match in _TOKEN_RE.finditer(snippet.lower()):
+            token = match.group()
+            if token in statement_tokens:
+                found.add(token)
+                if len(found) >= needed:
+                    return True
+        return False
+
     def _snippet(self, text: str, max_length: int = 120) -> str:
-        cleaned = " ".join(text.split())
+        # Collapse whitespace only as far as the snippet needs, not over the whole document.
+        parts: list[str] = []
+        length = -1
+        for match in _NON_SPACE_RE.finditer(text):
+            parts.append(match.group())
+            length += len(parts[-1]) + 1
+            if length > max_length:
+                break
+        cleaned = " ".join(parts)
         return cleaned[:max_length] + ("..." if len(cleaned) > max_length else "")
 
     # ------------------------------------------------------------------
@@ -448,6 +884,9 @@ class TextAnalyzer:
         """Flag suspect claims using Gemini AI for intelligent detection."""
         # Try Gemini-powered detection first
         if self._gemini_api_key and genai:
+            if _HAS_CLAIM_SIGNAL_RE.search(description) is None:
+                LOGGER.debug("No claim signals in description; skipping Gemini claim flagging.")
+                return self._flag_claims_rule_based(description)
             try:
                 return self._flag_claims_with_gemini(description)
             except Exception as exc:
@@ -458,10 +897,7 @@ class TextAnalyzer:
     
     def _flag_claims_with_gemini(self, description: str) -> list[ClaimFlag]:
         """Use Gemini AI to intelligently identify suspect claims."""
-        # Initialize Gemini client if needed
-        if self._gemini_client is None:
-            genai.configure(api_key=self._gemini_api_key)
-            self._gemini_client = genai.GenerativeModel(self._gemini_model)
+        self._get_gemini_client()
         
         # Clean and prepare text
         cleaned_desc = self._clean_text_for_gemini(description)[:3000]
@@ -485,36 +921,27 @@ class TextAnalyzer:
         )
         
         try:
-            response = self._gemini_client.generate_content(
+            response_text = self._gemini_generate(
+                self._gemini_client,
                 prompt,
-                generation_config={
+                {
                     "temperature": 0.3,  # Lower for more precise detection
                     "top_p": 0.9,
                     "top_k": 40,
                     "max_output_tokens": 800,
                 },
-                safety_settings=[
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                ]
             )
-            
-            if response and hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'content') and candidate.content and hasattr(candidate.content, 'parts'):
-                    if candidate.content.parts:
-                        response_text = candidate.content.parts[0].text.strip()
-                        
-                        if "NO_CLAIMS_FOUND" in response_text:
-                            LOGGER.info("Gemini found no suspicious claims")
-                            return []
-                        
-                        # Parse claims from response
-                        flags = self._parse_gemini_claims(response_text)
-                        LOGGER.info("Gemini identified %d suspicious claims", len(flags))
-                        return flags[:self._top_k]
+            if response_text is not None:
+                response_text = response_text.strip()
+                
+                if "NO_CLAIMS_FOUND" in response_text:
+                    LOGGER.info("Gemini found no suspicious claims")
+                    return []
+                
+                # Parse claims from response
+                flags = self._parse_gemini_claims(response_text)
+                LOGGER.info("Gemini identified %d suspicious claims", len(flags))
+                return flags[:self._top_k]
         except Exception as exc:
             LOGGER.warning("Gemini claim detection failed: %s", exc)
             raise
@@ -552,95 +979,116 @@ class TextAnalyzer:
     
     def _flag_claims_rule_based(self, description: str) -> list[ClaimFlag]:
         """Fallback rule-based claim detection."""
-        sentences = [sentence.strip() for sentence in re.split(r"[\.!?]\s+", description) if sentence.strip()]
-        keywords = {
-            "accuracy",
-            "guarantee",
-            "perfect",
-            "zero",
-            "100%",
-            "95%",
-            "state-of-the-art",
-            "breakthrough",
-        }
         flags: list[ClaimFlag] = []
-        for sentence in sentences:
-            numbers = re.findall(r"\b\d+(?:\.\d+)?%?\b", sentence)
-            lower = sentence.lower()
-            if numbers or any(word in lower for word in keywords):
-                reason_parts = []
-                if numbers:
-                    high_numbers = [num for num in numbers if num.endswith("%") and float(num.rstrip("%")) >= 90]
-                    if high_numbers:
-                        reason_parts.append(f"High success figures: {', '.join(high_numbers)}")
-                if "guarantee" in lower or "zero" in lower:
-                    reason_parts.append("Potentially absolute claim")
-                if "state-of-the-art" in lower or "breakthrough" in lower:
-                    reason_parts.append("Marketing language detected")
-                if not reason_parts:
-                    reason_parts.append("Contains quantifiable claim requiring verification")
-                flags.append(ClaimFlag(statement=sentence, reason="; ".join(reason_parts)))
-        return flags[: self._top_k]
+        if self._top_k <= 0:
+            return flags
+        # One scan of the whole description; each hit is attributed to its sentence
+        # by bisecting the separator offsets (no claim pattern spans a separator).
+        separators = [(match.start(), match.end()) for match in _SENT_SPLIT.finditer(description)]
+        boundaries = [sep_start for sep_start, _ in separators]
+        current = -1
+        numbers: list[str] = []
+        kinds: set[str] = set()
+        for match in _CLAIM_RE.finditer(description):
+            index = bisect_right(boundaries, match.start())
+            if index != current:
+                if current >= 0:
+                    flags.append(self._rule_based_flag(description, separators, current, numbers, kinds))
+                    if len(flags) >= self._top_k:
+                        return flags
+                current, numbers, kinds = index, [], set()
+            if match.lastgroup == "num":
+                numbers.append(match.group())
+            kinds.add(match.lastgroup)
+        if current >= 0:
+            flags.append(self._rule_based_flag(description, separators, current, numbers, kinds))
+        return flags
+
+    @staticmethod
+    def _rule_based_flag(
+        text: str,
+        separators: Sequence[tuple[int, int]],
+        index: int,
+        numbers: Sequence[str],
+        kinds: set[str],
+    ) -> ClaimFlag:
+        start = separators[index - 1][1] if index else 0
+        end = separators[index][0] if index < len(separators) else len(text)
+        reason_parts = []
+        high_numbers = [num for num in numbers if num.endswith("%") and float(num.rstrip("%")) >= 90]
+        if high_numbers:
+            reason_parts.append(f"High success figures: {', '.join(high_numbers)}")
+        if "absolute" in kinds:
+            reason_parts.append("Potentially absolute claim")
+        if "hype" in kinds:
+            reason_parts.append("Marketing language detected")
+        if not reason_parts:
+            reason_parts.append("Contains quantifiable claim requiring verification")
+        return ClaimFlag(statement=text[start:end].strip(), reason="; ".join(reason_parts))
 
     # ------------------------------------------------------------------
     # Local LLM enrichment
 
 
-    def _enrich_claims_with_gemini(self, description: str, claims: list[ClaimFlag]) -> list[ClaimFlag]:
-        """Use Gemini AI to verify and enrich claims."""
+    def _enrich_claims_with_gemini(self, description: str, claims: list[dict[str, Any]]) -> None:
+        """Use Gemini AI to verify and enrich claim rows in place."""
         try:
-            # Initialize Gemini client if needed
-            if self._gemini_client is None:
-                genai.configure(api_key=self._gemini_api_key)
-                self._gemini_client = genai.GenerativeModel(self._gemini_model)
+            self._get_gemini_client()
             
-            enriched: list[ClaimFlag] = []
-            for idx, claim in enumerate(claims):
-                if idx >= self._top_k:
-                    enriched.append(claim)
-                    continue
-                
+            targets = claims[: self._top_k]
+            if len(targets) > 1:
+                # One round-trip for all claims; only unparsed claims are retried singly.
+                verdicts = {}
+                try:
+                    response_text = self._gemini_generate(
+                        self._gemini_client,
+                        self._build_batch_claim_prompt(
+                            description, [claim["statement"] for claim in targets]
+                        ),
+                        {
+                            "temperature": 0.2,  # Low for factual analysis
+                            "top_p": 0.8,
+                            "top_k": 40,
+                            "max_output_tokens": 150 * len(targets),
+                        },
+                    )
+                    verdicts = self._parse_batch_verdicts(response_text or "")
+                except Exception as exc:
+                    # A failed batch must not cost every claim; fall through to per-claim calls.
+                    LOGGER.debug("Gemini batch claim verification failed: %s", exc)
+                for number, claim in enumerate(targets, start=1):
+                    if number in verdicts:
+                        claim["llm_verdict"], claim["llm_rationale"] = verdicts[number]
+                targets = [claim for claim in targets if "llm_verdict" not in claim]
+
+            for claim in targets:
                 # Build prompt for claim verification
-                prompt = self._build_claim_prompt(description, claim.statement)
+                prompt = self._build_claim_prompt(description, claim["statement"])
                 
                 try:
-                    response = self._gemini_client.generate_content(
+                    response_text = self._gemini_generate(
+                        self._gemini_client,
                         prompt,
-                        generation_config={
+                        {
                             "temperature": 0.2,  # Low for factual analysis
                             "top_p": 0.8,
                             "top_k": 40,
                             "max_output_tokens": 150,
                         },
-                        safety_settings=[
-                            {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                            {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                            {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                            {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                        ]
                     )
-                    
-                    # Parse response
-                    if response and hasattr(response, 'candidates') and response.candidates:
-                        candidate = response.candidates[0]
-                        if hasattr(candidate, 'content') and candidate.content and hasattr(candidate.content, 'parts'):
-                            if candidate.content.parts:
-                                response_text = candidate.content.parts[0].text
-                                verdict, rationale = self._parse_llm_verdict(response_text)
-                                enriched.append(replace(claim, llm_verdict=verdict, llm_rationale=rationale))
-                                continue
+                    if response_text is not None:
+                        verdict, rationale = self._parse_llm_verdict(response_text)
+                        claim["llm_verdict"] = verdict
+                        claim["llm_rationale"] = rationale
                 except Exception as exc:
-                    LOGGER.debug("Gemini claim verification failed for '%s': %s", claim.statement[:50], exc)
-                
-                # Fallback: keep claim without enrichment
-                enriched.append(claim)
+                    LOGGER.debug("Gemini claim verification failed for '%s': %s", claim["statement"][:50], exc)
+                # Claims without a parsed response are kept without enrichment
             
-            LOGGER.info("Enriched %d claims using Gemini AI", len([c for c in enriched if c.llm_verdict]))
-            return enriched
+            enriched = sum(1 for claim in claims if claim.get("llm_verdict"))
+            LOGGER.info("Enriched %d claims using Gemini AI", enriched)
             
         except Exception as exc:
             LOGGER.warning("Gemini claim enrichment failed: %s", exc)
-            return claims
 
     def _build_claim_prompt(self, description: str, claim: str) -> str:
         # Truncate description to reasonable length for Gemini context
@@ -657,69 +1105,145 @@ class TextAnalyzer:
             "Reason: <explanation up to 25 words>\n"
         )
 
+    def _build_batch_claim_prompt(self, description: str, claims: Sequence[str]) -> str:
+        description = (description.strip() or "No description provided.")[:2000]
+        listed = "\n".join(
+            f"Claim {number}: \"{claim.strip()}\"" for number, claim in enumerate(claims, start=1)
+        )
+        return (
+            "You are an impartial hackathon judge verifying factual claims.\n"
+            "Rate each claim as one of: plausible, needs_verification, implausible.\n"
+            "Provide a short reason for each.\n\n"
+            f"Project description:\n{description}\n\n"
+            f"{listed}\n\n"
+            "Respond with exactly two lines per claim, in order:\n"
+            "Claim <n> Verdict: <one word>\n"
+            "Claim <n> Reason: <explanation up to 25 words>\n"
+        )
+
+    def _parse_batch_verdicts(self, response: str) -> dict[int, Tuple[str, str]]:
+        return {
+            int(match.group(1)): (match.group(2).lower(), match.group(3).strip())
+            for match in _BATCH_VERDICT_RE.finditer(response)
+        }
+
     def _parse_llm_verdict(self, response: str) -> Tuple[str, str]:
         if not response:
             return "needs_verification", "Local LLM returned empty response."
-        verdict_match = re.search(
-            r"verdict\s*:\s*(plausible|needs_verification|implausible)",
-            response,
-            re.IGNORECASE,
-        )
+        verdict_match = _VERDICT_RE.search(response)
         verdict = verdict_match.group(1).lower() if verdict_match else "needs_verification"
-        reason_match = re.search(r"reason\s*:\s*(.+)", response, re.IGNORECASE)
+        reason_match = _REASON_RE.search(response)
         rationale = reason_match.group(1).strip() if reason_match else response.strip()[:160]
         return verdict, rationale
 
-    def _estimate_ai_generated(self, description: str) -> float:
-        description = description.strip()
+    def _estimate_ai_generated(self, stats: _DescStats) -> float:
+        description = stats.text
         if not description:
             return 0.0
 
-        # Try Gemini first for most accurate detection
+        # A confident local verdict settles it; only uncertain texts are sent to Gemini.
+        detector_score = self._run_ai_detector(description)
+        low, high = self._AI_DETECTOR_UNCERTAIN
+        if detector_score is not None and not low <= detector_score <= high:
+            return detector_score
+
         gemini_score = self._estimate_ai_with_gemini(description)
         if gemini_score is not None:
             return gemini_score
-
-        if pipeline and self._ai_detector_model:
-            try:  # pragma: no cover - optional dependency
-                if self._ai_detector is None:
-                    pipeline_kwargs: dict[str, object] = {
-                        "model": self._ai_detector_model,
-                        "top_k": None,
-                        "truncation": True,
-                    }
-                    if self._device_spec is not None:
-                        pipeline_kwargs["device"] = self._device_spec.pipeline_device
-                    self._ai_detector = pipeline("text-classification", **pipeline_kwargs)
-                truncated = description[: self._ai_detector_context_length]
-                result = self._ai_detector(truncated)
-                if isinstance(result, list) and result:
-                    entries = result[0] if isinstance(result[0], list) else result
-                    ai_score = 0.0
-                    for entry in entries:
-                        label = entry.get("label", "").lower()
-                        score = float(entry.get("score", 0.0))
-                        if "ai" in label or "fake" in label:
-                            ai_score = max(ai_score, score)
-                    if ai_score > 0.1:  # Only return if confident
-                        return ai_score
-            except Exception:
-                pass
+        if detector_score is not None:
+            return detector_score
 
         # Heuristic fallback: measure repetitiveness and lack of personal pronouns
-        tokens = [token.lower() for token in re.findall(r"\b\w+\b", description)]
-        if not tokens:
-            return 0.0
-        pronouns = {"i", "we", "our", "us", "team"}
-        pronoun_ratio = sum(token in pronouns for token in tokens) / len(tokens)
-        unique_ratio = len(set(tokens)) / len(tokens)
+        total = stats.word_total
+        if total < self._AI_HEURISTIC_MIN_TOKENS:
+            # Ratios over a handful of words are noise; report the neutral prior.
+            return self._AI_HEURISTIC_PRIOR if total else 0.0
+        pronoun_ratio = stats.pronoun_hits / total
+        unique_ratio = stats.unique_words / total
         repetition_score = max(0.0, 1.0 - unique_ratio)
         ai_likelihood = 0.4 * repetition_score + 0.3 * (0.2 - pronoun_ratio)
-        return max(0.0, min(1.0, ai_likelihood + 0.3))
+        return max(0.0, min(1.0, ai_likelihood + self._AI_HEURISTIC_PRIOR))
+
+    def _load_ai_detector(self) -> Callable[[str], list[tuple[str, float]]]:  # pragma: no cover - optional dependency
+        """Load the classifier once per process as ``text -> [(label, probability), ...]``.
+
+        Uses an exported ONNX graph when ``export_onnx`` is enabled, otherwise the
+        PyTorch model (FP16 on CUDA) under ``torch.inference_mode``.
+        """
+        if self._ai_detector is not None:
+            return self._ai_detector
+        device = (
+            self._device_spec.sentence_transformer_device if self._device_spec is not None else "cpu"
+        )
+        key = (self._ai_detector_model, device, self._export_onnx, self._ai_detector_context_length)
+        with self._SHARED_LOCK:
+            detector = self._AI_DETECTORS.get(key)
+            if detector is None:
+                detector = self._build_ai_detector(device)
+                self._AI_DETECTORS[key] = detector
+        self._ai_detector = detector
+        return detector
+
+    def _build_ai_detector(
+        self, device: str
+    ) -> Callable[[str], list[tuple[str, float]]]:  # pragma: no cover - optional dependency
+        onnx_path = self._onnx_artifact("ai_detector", self._ai_detector_model, sequence_classification=True)
+        if onnx_path is not None:
+            classifier = OnnxSequenceClassifier(
+                onnx_path, self._ai_detector_model, max_length=self._ai_detector_context_length
+            )
+            return classifier.predict
+
+        tokenizer = AutoTokenizer.from_pretrained(self._ai_detector_model)
+        model = AutoModelForSequenceClassification.from_pretrained(self._ai_detector_model)
+        model = model.to(device).eval()
+        if device.startswith("cuda"):
+            model = model.half()
+        max_length = min(self._ai_detector_context_length, tokenizer.model_max_length)
+
+        def predict(text: str) -> list[tuple[str, float]]:
+            inputs = tokenizer(
+                text, truncation=True, max_length=max_length, return_tensors="pt"
+            ).to(device)
+            with torch.inference_mode():
+                logits = model(**inputs).logits
+            probs = logits.float().softmax(-1)[0].cpu().tolist()
+            return [(str(model.config.id2label.get(index, index)), prob) for index, prob in enumerate(probs)]
+
+        return predict
+
+    def _run_ai_detector(self, description: str) -> float | None:
+        """Probability of the classifier's AI/"fake" label; ``None`` when unavailable."""
+        if not self._ai_detector_available():
+            return None
+        try:  # pragma: no cover - optional dependency
+            predict = self._load_ai_detector()
+            ai_score = None
+            for label, score in predict(description[: self._ai_detector_context_length]):
+                label = label.lower()
+                if ("ai" in label or "fake" in label) and (ai_score is None or score > ai_score):
+                    ai_score = score
+            return ai_score
+        except Exception as exc:
+            LOGGER.debug("Local AI detector failed: %s", exc)
+        return None
+
+    def _ai_detector_available(self) -> bool:
+        if not self._ai_detector_model:
+            return False
+        if torch is not None and AutoModelForSequenceClassification is not None:
+            return True
+        # A previously exported ONNX classifier runs without torch.
+        return (
+            self._export_onnx
+            and encoders.ort is not None
+            and encoders.AutoTokenizer is not None
+            and encoders.AutoConfig is not None
+        )
 
     def _estimate_ai_with_gemini(self, text: str) -> float | None:
         """Use Gemini to detect AI-generated content with high accuracy."""
-        if not self._gemini_api_key or not genai:
+        if not self._gemini_api_key or not genai or self._too_small_for_gemini(text):
             return None
         
         try:
@@ -728,10 +1252,7 @@ class TextAnalyzer:
             if len(text) > max_chars:
                 text = text[:max_chars] + "..."
             
-            # Initialize Gemini if needed
-            if not hasattr(self, '_gemini_ai_detector'):
-                genai.configure(api_key=self._gemini_api_key)
-                self._gemini_ai_detector = genai.GenerativeModel(self._gemini_model)
+            self._get_gemini_client()
             
             prompt = f"""Analyze the following text and determine the likelihood it was written by AI (like ChatGPT, Claude, Gemini, etc.) versus a human.
 
@@ -759,53 +1280,41 @@ Examples:
 - 0.2-0.3: Likely human (personal, casual, imperfect)
 - 0.0-0.1: Almost certainly human (very personal, unique voice)"""
 
-            response = self._gemini_ai_detector.generate_content(
+            result_text = self._gemini_generate(
+                self._gemini_client,
                 prompt,
-                generation_config={
+                {
                     "temperature": 0.3,  # Lower temperature for consistent analysis
                     "top_p": 0.9,
                     "top_k": 40,
                     "max_output_tokens": 200,
                 },
-                safety_settings=[
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                ]
             )
-            
-            if response and hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                if hasattr(candidate, 'content') and candidate.content and hasattr(candidate.content, 'parts'):
-                    if candidate.content.parts:
-                        result_text = candidate.content.parts[0].text.strip()
-                        
-                        # Try to parse JSON response
-                        try:
-                            # Extract JSON from markdown code blocks if present
-                            if "```json" in result_text:
-                                result_text = result_text.split("```json")[1].split("```")[0].strip()
-                            elif "```" in result_text:
-                                result_text = result_text.split("```")[1].split("```")[0].strip()
-                            
-                            import json
-                            result = json.loads(result_text)
-                            likelihood = float(result.get("likelihood", 0.5))
-                            confidence = result.get("confidence", "medium")
-                            reasoning = result.get("reasoning", "")
-                            
-                            LOGGER.info("✓ Gemini AI detection: likelihood=%.2f (%s confidence) - %s", 
-                                       likelihood, confidence, reasoning[:100])
-                            
-                            return max(0.0, min(1.0, likelihood))
-                        except (json.JSONDecodeError, ValueError) as e:
-                            LOGGER.warning("Failed to parse Gemini AI detection response: %s", e)
-                            # Try to extract likelihood from text if JSON parsing fails
-                            import re
-                            match = re.search(r'"likelihood":\s*([0-9.]+)', result_text)
-                            if match:
-                                return float(match.group(1))
+            if result_text is not None:
+                result_text = result_text.strip()
+                # Try to parse JSON response
+                try:
+                    # Extract JSON from markdown code blocks if present
+                    if "```json" in result_text:
+                        result_text = result_text.split("```json")[1].split("```")[0].strip()
+                    elif "```" in result_text:
+                        result_text = result_text.split("```")[1].split("```")[0].strip()
+                    
+                    result = json.loads(result_text)
+                    likelihood = float(result.get("likelihood", 0.5))
+                    confidence = result.get("confidence", "medium")
+                    reasoning = result.get("reasoning", "")
+                    
+                    LOGGER.info("✓ Gemini AI detection: likelihood=%.2f (%s confidence) - %s", 
+                               likelihood, confidence, reasoning[:100])
+                    
+                    return max(0.0, min(1.0, likelihood))
+                except (json.JSONDecodeError, ValueError) as e:
+                    LOGGER.warning("Failed to parse Gemini AI detection response: %s", e)
+                    # Try to extract likelihood from text if JSON parsing fails
+                    match = _LIKELIHOOD_RE.search(result_text)
+                    if match:
+                        return float(match.group(1))
         
         except Exception as exc:
             LOGGER.warning("Gemini AI detection failed: %s", exc)
@@ -840,14 +1349,11 @@ Examples:
 
     def _generate_summary_with_gemini(self, text: str) -> str | None:
         """Generate summary using Google Gemini Pro API."""
-        if not genai or not self._gemini_api_key:
+        if not genai or not self._gemini_api_key or self._too_small_for_gemini(text):
             return None
 
         try:
-            # Initialize Gemini client if not already done
-            if self._gemini_client is None:
-                genai.configure(api_key=self._gemini_api_key)
-                self._gemini_client = genai.GenerativeModel(self._gemini_model)
+            self._get_gemini_client()
 
             # Clean and prepare text to avoid RECITATION filtering
             cleaned_text = self._clean_text_for_gemini(text)
@@ -867,65 +1373,94 @@ Project Information:
 Write a detailed, fresh, original summary now:"""
 
             # Generate summary with higher temperature to encourage original phrasing
-            response = self._gemini_client.generate_content(
+            summary = self._gemini_generate(
+                self._gemini_client,
                 prompt,
-                generation_config={
+                {
                     "temperature": 0.7,  # Higher = more creative/original
                     "top_p": 0.95,
                     "top_k": 40,
                     "max_output_tokens": 400,  # Increased for longer summaries
                 },
-                safety_settings=[
-                    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                ]
             )
-
-            # Check if response is valid
-            if response and hasattr(response, 'candidates') and response.candidates:
-                candidate = response.candidates[0]
-                
-                # Check if generation completed successfully
-                if hasattr(candidate, 'content') and candidate.content and hasattr(candidate.content, 'parts'):
-                    if candidate.content.parts:
-                        summary = candidate.content.parts[0].text.strip()
-                        # Clean up any potential markdown formatting
-                        summary = re.sub(r'^#+\s*', '', summary)
-                        summary = re.sub(r'\*\*([^*]+)\*\*', r'\1', summary)
-                        if summary:
-                            LOGGER.info("Generated combined summary using Gemini Pro API")
-                            return summary
-                
-                # If we got here, response was blocked or empty
-                finish_reason = getattr(candidate, 'finish_reason', 'UNKNOWN')
-                LOGGER.warning("Gemini response blocked or empty (finish_reason=%s)", finish_reason)
+            if summary is not None:
+                summary = summary.strip()
+                # Clean up any potential markdown formatting
+                summary = _MD_LEADING_HEADER_RE.sub('', summary)
+                summary = _MD_BOLD_RE.sub(r'\1', summary)
+                if summary:
+                    LOGGER.info("Generated combined summary using Gemini Pro API")
+                    return summary
 
         except Exception as exc:
             LOGGER.warning("Gemini API call failed: %s", exc)
 
         return None
 
+    def _too_small_for_gemini(self, text: str) -> bool:
+        """Stub-sized or low-vocabulary text is not worth a round trip (and often gets blocked)."""
+        stripped = text.strip()
+        if len(stripped) < self._GEMINI_MIN_CHARS:
+            LOGGER.debug("Skipping Gemini for %d-character input.", len(stripped))
+            return True
+        if len(set(stripped.split())) < self._GEMINI_MIN_UNIQUE_WORDS:
+            LOGGER.debug("Skipping Gemini for input with too few distinct words.")
+            return True
+        return False
+
+    def _get_gemini_client(self) -> Any:
+        """Return the shared ``GenerativeModel`` for this API key and model name."""
+        if self._gemini_client is None:
+            key = (self._gemini_api_key, self._gemini_model)
+            with self._SHARED_LOCK:
+                client = self._GEMINI_CLIENTS.get(key)
+                if client is None:
+                    genai.configure(api_key=self._gemini_api_key)
+                    client = genai.GenerativeModel(self._gemini_model)
+                    self._GEMINI_CLIENTS[key] = client
+            self._gemini_client = client
+        return self._gemini_client
+
+    def _gemini_generate(
+        self, client: Any, prompt: str, generation_config: Mapping[str, Any]
+    ) -> str | None:
+        """Return the first candidate's text for ``prompt``, memoized in the response cache."""
+        key = ResponseCache.key(self._gemini_model, sorted(generation_config.items()), prompt)
+        if self._response_cache is not None:
+            cached = self._response_cache.get("gemini", key)
+            if isinstance(cached, str):
+                return cached
+
+        response = client.generate_content(
+            prompt,
+            generation_config=dict(generation_config),
+            safety_settings=self._GEMINI_SAFETY_SETTINGS,
+        )
+        if not (response and getattr(response, "candidates", None)):
+            return None
+        candidate = response.candidates[0]
+        content = getattr(candidate, "content", None)
+        if not (content and getattr(content, "parts", None)):
+            LOGGER.warning(
+                "Gemini response blocked or empty (finish_reason=%s)",
+                getattr(candidate, "finish_reason", "UNKNOWN"),
+            )
+            return None
+        text = content.parts[0].text
+        if self._response_cache is not None:
+            self._response_cache.set("gemini", key, text)
+        return text
+
     def _clean_text_for_gemini(self, text: str) -> str:
         """Clean and prepare text to reduce RECITATION filtering triggers."""
-        # Remove emojis and special unicode characters
-        cleaned = re.sub(r'[^\x00-\x7F]+', ' ', text)
-        
-        # Remove markdown formatting
-        cleaned = re.sub(r'#+\s*', '', cleaned)  # Headers
-        cleaned = re.sub(r'\*\*([^*]+)\*\*', r'\1', cleaned)  # Bold
-        cleaned = re.sub(r'\*([^*]+)\*', r'\1', cleaned)  # Italic
-        cleaned = re.sub(r'`([^`]+)`', r'\1', cleaned)  # Code
-        
-        # Remove URLs to reduce training data matches
-        cleaned = re.sub(r'https?://[^\s]+', '', cleaned)
-        
-        # Remove common tutorial boilerplate phrases
-        cleaned = re.sub(r'(Clone the Repository|Getting Started|Installation|How to Run)', '', cleaned, flags=re.IGNORECASE)
+        # Replace emojis/non-ASCII runs with a space (C codec scan, skipped for ASCII text)
+        if not text.isascii():
+            text = text.encode("ascii", _ASCII_SPACE_ERRORS).decode("ascii")
+        # Strip markdown markup, URLs and tutorial boilerplate in one pass
+        cleaned = _CLEAN_RE.sub(_clean_replacement, text)
         
         # Normalize whitespace
-        cleaned = re.sub(r'\s+', ' ', cleaned)
+        cleaned = _WS_RE.sub(' ', cleaned)
         
         # Truncate to avoid overwhelming (keep first 2000 chars)
         if len(cleaned) > 2000:
@@ -1,32 +1,76 @@
 from __future__ import annotations
 
+import hashlib
+import importlib
+import importlib.util
 import logging
-import tempfile
+import shutil
+import subprocess
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, asdict
+from functools import partial
 from pathlib import Path
-from typing import Iterable, Mapping, Tuple
+from typing import Any, Callable, Iterable, Mapping, Sequence, Tuple
 
 from ..utils.file_helpers import read_submission_description, read_text
-from ..utils.torch_helpers import DeviceSpec
+from ..utils.fingerprint import file_digest
+from ..utils.torch_helpers import DeviceSpec, available_cpu_count
 
 try:  # pragma: no cover - optional heavy dependency
-    import whisper
+    import numpy as np  # type: ignore
 except ImportError:  # pragma: no cover - optional heavy dependency
-    whisper = None
+    np = None  # type: ignore
 
 try:  # pragma: no cover - optional heavy dependency
-    from moviepy.editor import VideoFileClip  # type: ignore
+    import imageio_ffmpeg  # type: ignore
 except ImportError:  # pragma: no cover - optional heavy dependency
-    VideoFileClip = None  # type: ignore
-
-try:  # pragma: no cover - optional heavy dependency
-    from transformers import pipeline  # type: ignore
-except ImportError:  # pragma: no cover - optional heavy dependency
-    pipeline = None  # type: ignore
+    imageio_ffmpeg = None  # type: ignore
 
 
 LOGGER = logging.getLogger(__name__)
 
+# Whisper, moviepy and transformers each pull in torch or ffmpeg bindings; they are imported
+# on first use so loading results (``VideoAnalysisResult``) stays cheap.
+_UNSET = object()
+_LAZY_IMPORTS: dict[tuple[str, str | None], Any] = {}
+
+
+def _lazy_import(module: str, attr: str | None = None) -> Any | None:
+    """``module`` (or ``module.attr``) imported on first call; ``None`` when not installed."""
+    key = (module, attr)
+    value = _LAZY_IMPORTS.get(key, _UNSET)
+    if value is _UNSET:
+        try:  # pragma: no cover - optional heavy dependency
+            value = importlib.import_module(module)
+            if attr is not None:
+                value = getattr(value, attr)
+        except (ImportError, AttributeError):  # pragma: no cover - optional heavy dependency
+            value = None
+        _LAZY_IMPORTS[key] = value
+    return value
+
+
+def _installed(module: str) -> bool:
+    """Whether a top-level package is importable, without importing it."""
+    return importlib.util.find_spec(module) is not None
+
+
+# Whisper models expect 16 kHz mono input.
+_SAMPLE_RATE = 16_000
+
+
+def _ffmpeg_executable() -> str | None:
+    """System ffmpeg, else the binary bundled with imageio-ffmpeg (a moviepy dependency)."""
+    found = shutil.which("ffmpeg")
+    if found is None and imageio_ffmpeg is not None:
+        try:
+            found = imageio_ffmpeg.get_ffmpeg_exe()
+        except Exception:  # pragma: no cover - depends on the bundled binary
+            found = None
+    return found
+
 
 @dataclass(frozen=True)
 class VideoAnalysisResult:
@@ -57,22 +101,86 @@ class VideoAnalysisResult:
 class VideoAnalyzer:
     """Hybrid video analyzer with transcription, sentiment, and heuristics."""
 
+    # Loaded models are shared by every analyzer (and thread) with the same settings.
+    _SHARED_LOCK = threading.Lock()
+    _SHARED_MODELS: dict[tuple[Any, ...], Any] = {}
+    # Recently used transcripts by content digest, oldest first; bounded for long-lived servers.
+    _SHARED_TRANSCRIPTS: dict[tuple[Any, ...], Tuple[str, float | None]] = {}
+    _MAX_SHARED_TRANSCRIPTS = 64
+    # Only held while a transcription is in flight.
+    _TRANSCRIPT_LOCKS: dict[tuple[Any, ...], threading.Lock] = {}
+    # openai-whisper installs kv-cache hooks on the model per call, so its decodes are serialized.
+    _WHISPER_LOCK = threading.Lock()
+    _SENTIMENT_BATCH_SIZE = 16
+    _PREPARE_WORKERS = 4
+    _POSITIVE_WORDS = frozenset({"great", "good", "progress", "success", "innovation"})
+    _NEGATIVE_WORDS = frozenset({"issue", "problem", "failure", "risk", "concern"})
+    _PUNCT_TABLE = str.maketrans("", "", ".,!?;:\"'()")
+
     def __init__(
         self,
         transcript_fallback: Iterable[str] | None = None,
         transcription_model: str = "base",
         sentiment_model: str = "distilbert-base-uncased-finetuned-sst-2-english",
         device_spec: DeviceSpec | None = None,
+        compute_type: str | None = None,
+        sentiment_quantization: str = "fp32",
+        models_dir: Path | None = None,
     ) -> None:
         self._fallback_lines = list(transcript_fallback or ())
         self._transcription_model = transcription_model
+        # CTranslate2 quantization for faster-whisper; None picks int8 (CPU) / int8_float16 (CUDA).
+        self._compute_type = compute_type
         self._sentiment_model = sentiment_model
+        if sentiment_quantization not in {"fp32", "int8"}:
+            raise ValueError(
+                f"Unsupported sentiment quantization '{sentiment_quantization}'; expected 'fp32' or 'int8'."
+            )
+        # "int8" runs a dynamically quantized ONNX export under ``models_dir`` when available.
+        self._sentiment_quantization = sentiment_quantization
+        self._models_dir = Path(models_dir) if models_dir is not None else None
         self._sentiment_pipeline = None
         self._device_spec = device_spec
+        # Checked once so submissions without a transcript skip the video probe entirely.
+        self._can_transcribe = (_installed("faster_whisper") or _installed("whisper")) and np is not None
 
     def analyze(self, submission_dir: Path) -> VideoAnalysisResult:
+        return self.analyze_many([submission_dir])[0]
+
+    def analyze_many(self, submission_dirs: Sequence[Path]) -> list[VideoAnalysisResult]:
+        """Analyze several submissions, running sentiment as one batched model call."""
+        # Pool width also sizes the shared faster-whisper model, so one submission gets every core.
+        workers = max(1, min(self._PREPARE_WORKERS, len(submission_dirs)))
+        if workers > 1:
+            # ffmpeg runs out of process and the Whisper backends release the GIL while decoding.
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                prepared = list(executor.map(partial(self._prepare, workers=workers), submission_dirs))
+        else:
+            prepared = [self._prepare(submission_dir) for submission_dir in submission_dirs]
+        sentiments = self._analyze_sentiment_batch([item[0] for item in prepared])
+        return [
+            VideoAnalysisResult(
+                transcript=transcript.strip(),
+                clarity_score=clarity,
+                estimated_duration_seconds=duration,
+                sentiment_label=sentiment_label,
+                sentiment_score=sentiment_score,
+                transcription_source=source,
+            )
+            for (transcript, source, clarity, duration), (sentiment_label, sentiment_score) in zip(
+                prepared, sentiments
+            )
+        ]
+
+    def _prepare(self, submission_dir: Path, workers: int = 1) -> Tuple[str, str, float, float]:
+        """Transcript, its source, clarity and duration for one submission.
+
+        ``workers`` is the number of submissions being prepared concurrently.
+        """
         transcript_path = submission_dir / "presentation_transcript.txt"
-        transcript, source = self._load_transcript(submission_dir, transcript_path)
+        transcript, source, media_duration = self._load_transcript(
+            submission_dir, transcript_path, workers
+        )
 
         if not transcript.strip():
             fallback_text, fallback_source = read_submission_description(submission_dir)
@@ -83,75 +191,162 @@ class VideoAnalyzer:
                 transcript = "\n".join(self._fallback_lines) or "No transcript available."
                 source = "manual_fallback"
 
-        clarity = self._estimate_clarity(transcript)
-        duration = self._estimate_duration(submission_dir / "presentation.mp4", transcript)
-        sentiment_label, sentiment_score = self._analyze_sentiment(transcript)
-
-        return VideoAnalysisResult(
-            transcript=transcript.strip(),
-            clarity_score=clarity,
-            estimated_duration_seconds=duration,
-            sentiment_label=sentiment_label,
-            sentiment_score=sentiment_score,
-            transcription_source=source,
-        )
+        word_count = len(transcript.split())
+        clarity = self._estimate_clarity(transcript, word_count)
+        if media_duration is not None:
+            duration = round(media_duration, 3)  # measured while decoding; no second open
+        else:
+            duration = self._estimate_duration(submission_dir / "presentation.mp4", word_count)
+        return transcript, source, clarity, duration
 
     # ------------------------------------------------------------------
     # Transcript handling
-    def _load_transcript(self, submission_dir: Path, transcript_path: Path) -> Tuple[str, str]:
+    def _load_transcript(
+        self, submission_dir: Path, transcript_path: Path, workers: int = 1
+    ) -> Tuple[str, str, float | None]:
+        """Transcript text, its source, and the media duration when audio was decoded."""
         if transcript_path.exists():
-            return read_text(transcript_path), "submission_transcript"
+            return read_text(transcript_path), "submission_transcript", None
+
+        if not self._can_transcribe:
+            return "", "missing_transcript", None
 
         video_path = submission_dir / "presentation.mp4"
         if video_path.exists():
-            transcript = self._transcribe_video(video_path)
+            transcript, duration = self._transcribe_once(video_path, workers)
             if transcript:
-                return transcript, "whisper_transcription"
+                return transcript, "whisper_transcription", duration
+            return "", "missing_transcript", duration
 
-        return "", "missing_transcript"
+        return "", "missing_transcript", None
 
-    def _transcribe_video(self, video_path: Path) -> str | None:
-        if whisper is None:
+    def _transcribe_once(self, video_path: Path, workers: int = 1) -> Tuple[str | None, float | None]:
+        """Transcribe ``video_path``, reusing the result for byte-identical copies."""
+        try:
+            key = (file_digest(video_path), self._transcription_model, self._compute_type)
+        except OSError as exc:
+            LOGGER.debug("Could not fingerprint %s: %s", video_path, exc)
+            return self._transcribe_video(video_path, workers)
+        with self._SHARED_LOCK:
+            key_lock = self._TRANSCRIPT_LOCKS.setdefault(key, threading.Lock())
+        # Concurrent copies of one video wait for the first transcription instead of repeating it.
+        with key_lock:
+            with self._SHARED_LOCK:
+                cached = self._SHARED_TRANSCRIPTS.pop(key, None)
+                if cached is not None:
+                    self._SHARED_TRANSCRIPTS[key] = cached  # re-insert as most recent
+            if cached is not None:
+                LOGGER.debug("Reusing transcript of identical video for %s", video_path)
+                return cached
+            transcript, duration = None, None
+            try:
+                transcript, duration = self._transcribe_video(video_path, workers)
+            finally:
+                with self._SHARED_LOCK:
+                    if transcript:
+                        self._SHARED_TRANSCRIPTS[key] = (transcript, duration)
+                        while len(self._SHARED_TRANSCRIPTS) > self._MAX_SHARED_TRANSCRIPTS:
+                            del self._SHARED_TRANSCRIPTS[next(iter(self._SHARED_TRANSCRIPTS))]
+                    # Waiters already hold this lock; later callers find the stored transcript.
+                    self._TRANSCRIPT_LOCKS.pop(key, None)
+            return transcript, duration
+
+    def _transcribe_video(self, video_path: Path, workers: int = 1) -> Tuple[str | None, float | None]:
+        """Transcript and audio duration in seconds (either may be ``None``)."""
+        if _lazy_import("faster_whisper", "WhisperModel") is None and _lazy_import("whisper") is None:
             LOGGER.debug("Skipping transcription for %s: whisper not installed", video_path)
-            return None
-        if VideoFileClip is None:
-            LOGGER.debug("Skipping transcription for %s: moviepy not installed", video_path)
-            return None
+            return None, None
+        ffmpeg = _ffmpeg_executable()
+        if ffmpeg is None or np is None:
+            LOGGER.debug("Skipping transcription for %s: ffmpeg or numpy unavailable", video_path)
+            return None, None
 
-        audio_path = None
+        duration = None
         try:
-            with VideoFileClip(str(video_path)) as clip:  # type: ignore[attr-defined]
-                if clip.audio is None:
-                    LOGGER.warning("Video '%s' has no audio track for transcription.", video_path)
-                    return None
-                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                    audio_path = Path(tmp.name)
-                clip.audio.write_audiofile(str(audio_path), verbose=False, logger=None)
-
-            model = whisper.load_model(self._transcription_model)
-            result = model.transcribe(str(audio_path))
-            transcript = result.get("text", "").strip()
-            return transcript or None
+            audio = self._load_audio(ffmpeg, video_path)
+            if audio is None:
+                LOGGER.warning("Video '%s' has no audio track for transcription.", video_path)
+                return None, None
+            duration = len(audio) / _SAMPLE_RATE
+            transcript = self._run_transcription(audio, workers).strip()
+            return transcript or None, duration
         except Exception as exc:  # pragma: no cover - dependent on external libs
             LOGGER.warning("Video transcription failed for '%s': %s", video_path, exc)
+            return None, duration
+
+    @staticmethod
+    def _load_audio(ffmpeg: str, video_path: Path) -> Any | None:  # pragma: no cover - needs ffmpeg
+        """Decode the audio track straight to 16 kHz mono float32, with no temporary WAV file."""
+        command = [
+            ffmpeg, "-nostdin", "-loglevel", "error", "-i", str(video_path),
+            "-vn", "-f", "s16le", "-acodec", "pcm_s16le", "-ac", "1", "-ar", str(_SAMPLE_RATE), "-",
+        ]
+        raw = subprocess.run(command, capture_output=True, check=True).stdout
+        if not raw:
             return None
-        finally:
-            if audio_path:
-                try:
-                    Path(audio_path).unlink(missing_ok=True)
-                except OSError:
-                    LOGGER.debug("Temporary audio file cleanup failed for %s", audio_path)
+        return np.frombuffer(raw, np.int16).astype(np.float32) / 32768.0
+
+    def _run_transcription(self, audio: Any, workers: int = 1) -> str:  # pragma: no cover - dependent on external libs
+        """Transcribe with faster-whisper (CTranslate2, int8) when installed, else openai-whisper."""
+        on_cuda = self._device_spec is not None and self._device_spec.kind == "cuda"
+        WhisperModel = _lazy_import("faster_whisper", "WhisperModel")
+        if WhisperModel is not None:
+            compute_type = self._compute_type or ("int8_float16" if on_cuda else "int8")
+            kwargs: dict[str, Any] = {
+                "device": "cuda" if on_cuda else "cpu",
+                "compute_type": compute_type,
+                # One CTranslate2 replica per prepare thread; split the cores between them on CPU.
+                "num_workers": workers,
+            }
+            if not on_cuda:
+                kwargs["cpu_threads"] = max(1, available_cpu_count() // workers)
+            if on_cuda and isinstance(self._device_spec.pipeline_device, int):
+                kwargs["device_index"] = self._device_spec.pipeline_device
+            model = self._shared_model(
+                ("faster-whisper", self._transcription_model, tuple(sorted(kwargs.items()))),
+                lambda: WhisperModel(self._transcription_model, **kwargs),
+            )
+            # VAD skips silent stretches, which are common in recorded demos.
+            segments, _ = model.transcribe(audio, beam_size=1, vad_filter=True)
+            return "".join(segment.text for segment in segments)
+
+        whisper = _lazy_import("whisper")
+        # Honour an explicit device; without a spec whisper picks CUDA itself when present.
+        device = self._device_spec.sentence_transformer_device if self._device_spec is not None else None
+        if device == "mps":
+            device = "cpu"  # whisper's sparse alignment ops are unsupported on MPS
+        model = self._shared_model(
+            ("whisper", self._transcription_model, device),
+            lambda: whisper.load_model(self._transcription_model, device=device),
+        )
+        # FP16 halves weight traffic and uses tensor cores; it only applies on CUDA.
+        fp16 = str(getattr(model, "device", "cpu")).startswith("cuda")
+        with self._WHISPER_LOCK:
+            result = model.transcribe(audio, fp16=fp16)
+        return result.get("text", "")
+
+    @classmethod
+    def _shared_model(cls, key: tuple[Any, ...], factory: Callable[[], Any]) -> Any:
+        """Load a model once per process; the lock keeps concurrent analyzers from double-loading."""
+        with cls._SHARED_LOCK:
+            model = cls._SHARED_MODELS.get(key)
+            if model is None:
+                model = factory()
+                cls._SHARED_MODELS[key] = model
+            return model
 
     # ------------------------------------------------------------------
     # Metrics & heuristics
-    def _estimate_clarity(self, transcript: str) -> float:
-        if not transcript.strip():
+    def _estimate_clarity(self, transcript: str, word_count: int) -> float:
+        if word_count == 0:
             return 0.0
+        # str.count is a C-level memchr-style scan; three of them beat one Python loop.
         sentences = transcript.count(".") + transcript.count("!") + transcript.count("?")
-        clarity = min(1.0, max(0.3, sentences / max(1, len(transcript.split()) / 15)))
+        clarity = min(1.0, max(0.3, sentences / max(1, word_count / 15)))
         return round(clarity, 3)
 
-    def _estimate_duration(self, video_path: Path, transcript: str) -> float:
+    def _estimate_duration(self, video_path: Path, word_count: int) -> float:
+        VideoFileClip = _lazy_import("moviepy.editor", "VideoFileClip")
         if VideoFileClip is not None and video_path.exists():
             try:  # pragma: no cover - dependent on moviepy
                 with VideoFileClip(str(video_path)) as clip:  # type: ignore[attr-defined]
@@ -159,48 +354,109 @@ class VideoAnalyzer:
                         return round(float(clip.duration), 3)
             except Exception as exc:
                 LOGGER.debug("Unable to read video duration for '%s': %s", video_path, exc)
-        return max(len(transcript.split()) / 2.5, 30.0)
+        return max(word_count / 2.5, 30.0)
 
     def _analyze_sentiment(self, transcript: str) -> Tuple[str, float]:
-        if not transcript.strip():
-            return "neutral", 0.0
+        return self._analyze_sentiment_batch([transcript])[0]
+
+    def _analyze_sentiment_batch(self, transcripts: Sequence[str]) -> list[Tuple[str, float]]:
+        results: list[Tuple[str, float]] = [("neutral", 0.0)] * len(transcripts)
+        pending = [index for index, transcript in enumerate(transcripts) if transcript.strip()]
+        if not pending:
+            return results
 
-        if pipeline is None:
-            return self._heuristic_sentiment(transcript)
+        if not _installed("transformers"):
+            for index in pending:
+                results[index] = self._heuristic_sentiment(transcripts[index])
+            return results
 
         try:  # pragma: no cover - dependent on transformers
             if self._sentiment_pipeline is None:
-                kwargs = {"model": self._sentiment_model}
-                if self._device_spec is not None:
-                    kwargs["device"] = self._device_spec.pipeline_device
-                self._sentiment_pipeline = pipeline("sentiment-analysis", **kwargs)
-            truncated = transcript[:4096]
-            result = self._sentiment_pipeline(truncated)[0]
-            label = str(result.get("label", "neutral")).lower()
-            score = float(result.get("score", 0.0))
-            if label in {"pos", "positive"}:
-                label = "positive"
-            elif label in {"neg", "negative"}:
-                label = "negative"
-            elif label != "neutral":
-                label = "neutral"
-            return label, round(score, 3)
+                self._sentiment_pipeline = self._load_sentiment_pipeline()
+            outputs = self._sentiment_pipeline(
+                [transcripts[index][:4096] for index in pending],
+                batch_size=self._SENTIMENT_BATCH_SIZE,
+                truncation=True,
+            )
+            for index, result in zip(pending, outputs):
+                results[index] = self._normalize_sentiment(result)
         except Exception as exc:
             LOGGER.debug("Sentiment analysis failed: %s", exc)
-            return self._heuristic_sentiment(transcript)
+            for index in pending:
+                results[index] = self._heuristic_sentiment(transcripts[index])
+        return results
+
+    def _load_sentiment_pipeline(self) -> Callable[..., Any]:  # pragma: no cover - dependent on transformers
+        if self._sentiment_quantization == "int8":
+            classifier = self._shared_model(
+                ("sentiment-int8", self._sentiment_model, self._models_dir),
+                self._build_int8_classifier,
+            )
+            if classifier is not False:
+                return self._classifier_pipeline(classifier)
+        pipeline = _lazy_import("transformers", "pipeline")
+        kwargs = {"model": self._sentiment_model}
+        if self._device_spec is not None:
+            kwargs["device"] = self._device_spec.pipeline_device
+        return self._shared_model(
+            ("sentiment", self._sentiment_model, kwargs.get("device")),
+            lambda: pipeline("sentiment-analysis", **kwargs),
+        )
 
-    def _heuristic_sentiment(self, transcript: str) -> Tuple[str, float]:
-        positive_words = {"great", "good", "progress", "success", "innovation"}
-        negative_words = {"issue", "problem", "failure", "risk", "concern"}
+    def _build_int8_classifier(self) -> Any:  # pragma: no cover - depends on optional libs
+        """INT8 ONNX classifier for the sentiment model, or ``False`` to fall back to the pipeline."""
+        from ..utils import encoders
 
-        tokens = [token.strip(".,!?").lower() for token in transcript.split()]
-        pos_hits = sum(token in positive_words for token in tokens)
-        neg_hits = sum(token in negative_words for token in tokens)
+        if self._models_dir is None or not encoders.onnx_export_available():
+            LOGGER.debug("INT8 sentiment unavailable; using the %s pipeline", self._sentiment_model)
+            return False
+        slug = hashlib.blake2b(self._sentiment_model.encode("utf-8"), digest_size=8).hexdigest()
+        path = self._models_dir / "onnx" / slug / "sentiment.onnx"
+        try:
+            exported = encoders.export_onnx(self._sentiment_model, path, sequence_classification=True)
+            return encoders.OnnxSequenceClassifier(
+                encoders.quantize_onnx_int8(exported), self._sentiment_model
+            )
+        except Exception as exc:
+            LOGGER.warning("INT8 export of %s failed, using PyTorch: %s", self._sentiment_model, exc)
+            return False
+
+    @staticmethod
+    def _classifier_pipeline(classifier: Any) -> Callable[..., list[dict[str, object]]]:
+        """Adapt an ONNX classifier to the ``pipeline(texts, batch_size=...)`` call shape."""
+
+        def run(texts: Sequence[str], batch_size: int = 16, **_: Any) -> list[dict[str, object]]:
+            outputs: list[dict[str, object]] = []
+            for start in range(0, len(texts), batch_size):
+                for scores in classifier.predict_batch(texts[start : start + batch_size]):
+                    label, score = max(scores, key=lambda item: item[1])
+                    outputs.append({"label": label, "score": score})
+            return outputs
+
+        return run
+
+    @staticmethod
+    def _normalize_sentiment(result: Mapping[str, object]) -> Tuple[str, float]:
+        label = str(result.get("label", "neutral")).lower()
+        score = float(result.get("score", 0.0))
+        if label in {"pos", "positive"}:
+            label = "positive"
+        elif label in {"neg", "negative"}:
+            label = "negative"
+        elif label != "neutral":
+            label = "neutral"
+        return label, round(score, 3)
+
+    def _heuristic_sentiment(self, transcript: str) -> Tuple[str, float]:
+        counts = Counter(transcript.translate(self._PUNCT_TABLE).lower().split())
+        total = sum(counts.values())
+        pos_hits = sum(counts[word] for word in self._POSITIVE_WORDS)
+        neg_hits = sum(counts[word] for word in self._NEGATIVE_WORDS)
 
         if pos_hits == neg_hits:
             return "neutral", 0.5
         if pos_hits > neg_hits:
-            score = min(1.0, 0.6 + pos_hits / max(1, len(tokens)))
+            score = min(1.0, 0.6 + pos_hits / max(1, total))
             return "positive", round(score, 3)
-        score = min(1.0, 0.6 + neg_hits / max(1, len(tokens)))
+        score = min(1.0, 0.6 + neg_hits / max(1, total))
         return "negative", round(score, 3)
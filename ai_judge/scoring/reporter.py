@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+import csv
+import hashlib
+import json
+import os
+import tempfile
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, Sequence
+from typing import Any, ClassVar, Dict, Mapping, Sequence
 
-import pandas as pd
-from jinja2 import Environment, PackageLoader, select_autoescape
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    PackageLoader,
+    Template,
+    select_autoescape,
+)
 
-from ..utils.file_helpers import ensure_directory
+from ..utils.file_helpers import ensure_directory, read_json, write_json
 
 try:  # pragma: no cover - optional dependency used for visualizations
     import matplotlib
@@ -24,36 +36,108 @@ except ImportError:  # pragma: no cover
     markdown = None  # type: ignore
 
 
+def _markdown_filter(text):
+    if not text:
+        return ""
+    if markdown is not None:
+        try:
+            if isinstance(text, str):
+                return _render_markdown(text)
+            return markdown.markdown(
+                text,
+                extensions=['extra', 'nl2br', 'sane_lists']
+            )
+        except Exception:
+            # Fallback to plain text if markdown fails
+            return text
+    return text
+
+
+@lru_cache(maxsize=1024)
+def _render_markdown(text: str) -> str:
+    # Claim reasons, lint messages and criterion notes repeat across submissions.
+    return markdown.markdown(text, extensions=['extra', 'nl2br', 'sane_lists'])
+
+
+def _bytecode_cache() -> BytecodeCache | None:
+    """Opt-in on-disk cache of compiled templates, shared across CLI runs.
+
+    ``AI_JUDGE_JINJA_CACHE=1`` uses a directory under the system temp dir; any other
+    non-false value is taken as the cache directory itself.
+    """
+    setting = os.getenv("AI_JUDGE_JINJA_CACHE", "").strip()
+    if setting.lower() in {"", "0", "false", "no", "off"}:
+        return None
+    if setting.lower() in {"1", "true", "yes", "on"}:
+        directory = Path(tempfile.gettempdir()) / "ai_judge_jinja"
+    else:
+        directory = Path(setting).expanduser()
+    try:
+        return FileSystemBytecodeCache(str(ensure_directory(directory)))
+    except OSError:
+        return None
+
+
+# Charts are small inline images; 100 dpi and fast zlib keep savefig's encode step cheap.
+_CHART_DPI = 100
+_PNG_OPTIONS = {"compress_level": 1}
+_PNG_METADATA = {"Software": None}
+# The metric charts have fixed short labels, so fixed margins replace tight_layout's extra
+# draw pass; the criteria chart keeps tight_layout for its configurable rotated labels.
+_METRIC_CHART_MARGINS = {"left": 0.12, "right": 0.97, "bottom": 0.1, "top": 0.86}
+# Bump when chart styling changes so charts cached by fingerprint are redrawn.
+_CHART_STYLE_VERSION = 1
+_CHART_MANIFEST = "charts.json"
+
+# (csv column, payload section, metric key) for every numeric leaderboard column.
+_LEADERBOARD_METRICS = (
+    ("total_score", "score", "total"),
+    ("video_clarity", "video_analysis", "clarity_score"),
+    ("video_sentiment", "video_analysis", "sentiment_score"),
+    ("text_originality", "text_analysis", "originality_score"),
+    ("text_feasibility", "text_analysis", "feasibility_score"),
+    ("code_readability", "code_analysis", "readability_score"),
+    ("code_documentation", "code_analysis", "documentation_score"),
+    ("code_test_estimate", "code_analysis", "test_coverage_score_estimate"),
+)
+
+
 @dataclass(slots=True)
 class ReportGenerator:
     """Generates submission reports and an aggregated leaderboard."""
 
     output_dir: Path
     _env: Environment = field(init=False, repr=False)
+    # One Jinja environment and compiled report template shared by every generator.
+    _shared_env: ClassVar[Environment | None] = None
+    _shared_template: ClassVar[Template | None] = None
 
     def __post_init__(self) -> None:
-        self._env = Environment(  # pragma: no cover - template configuration
-            loader=PackageLoader("ai_judge", "templates"),
-            autoescape=select_autoescape(("html", "xml")),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        # Add markdown filter for rendering AI insights
-        def markdown_filter(text):
-            if not text:
-                return ""
-            if markdown is not None:
-                try:
-                    return markdown.markdown(
-                        text,
-                        extensions=['extra', 'nl2br', 'sane_lists']
-                    )
-                except Exception:
-                    # Fallback to plain text if markdown fails
-                    return text
-            return text
-        
-        self._env.filters['markdown'] = markdown_filter
+        self._env = self._get_env()
+
+    @classmethod
+    def _get_env(cls) -> Environment:
+        if cls._shared_env is None:
+            env = Environment(  # pragma: no cover - template configuration
+                loader=PackageLoader("ai_judge", "templates"),
+                autoescape=select_autoescape(("html", "xml")),
+                trim_blocks=True,
+                lstrip_blocks=True,
+                # Templates ship with the package; skip per-lookup mtime checks.
+                auto_reload=False,
+                cache_size=-1,
+                bytecode_cache=_bytecode_cache(),
+            )
+            # Add markdown filter for rendering AI insights
+            env.filters['markdown'] = _markdown_filter
+            cls._shared_env = env
+        return cls._shared_env
+
+    @classmethod
+    def _get_template(cls) -> Template:
+        if cls._shared_template is None:
+            cls._shared_template = cls._get_env().get_template("submission_report.html.j2")
+        return cls._shared_template
 
     def generate_submission_report(self, submission_name: str, payload: Mapping[str, Any]) -> Path:
         ensure_directory(self.output_dir)
@@ -66,9 +150,8 @@ class ReportGenerator:
                 "key": key,
                 **entry,
             }
-            for key, entry in criteria_map.items()
+            for key, entry in criteria_map.items()  # ScoreBreakdown emits these heaviest first
         ]
-        criteria.sort(key=lambda item: item.get("normalized_weight", 0.0), reverse=True)
 
         video = dict(payload.get("video_analysis", {}))
         text = dict(payload.get("text_analysis", {}))
@@ -129,56 +212,29 @@ class ReportGenerator:
             "charts": chart_paths,
         }
 
-        template = self._env.get_template("submission_report.html.j2")
-        report_path.write_text(template.render(**context), encoding="utf-8")
+        # Rendered chunk by chunk straight to disk; the full HTML is never held as one string.
+        # The rename publishes the report atomically, so readers never see it half written.
+        partial_path = report_path.with_name(f".{report_path.name}.tmp")
+        self._get_template().stream(**context).dump(str(partial_path), encoding="utf-8")
+        os.replace(partial_path, report_path)
         return report_path
 
     def generate_leaderboard(self, submissions: Sequence[Mapping[str, Any]]) -> Path:
         ensure_directory(self.output_dir)
         leaderboard_path = self.output_dir / "leaderboard.csv"
 
-        rows: list[Dict[str, Any]] = []
-        for entry in submissions:
-            score = entry.get("score", {})
-            video = entry.get("video_analysis", {})
-            text = entry.get("text_analysis", {})
-            code = entry.get("code_analysis", {})
-            rows.append(
-                {
-                    "submission": entry.get("submission", "unknown"),
-                    "total_score": score.get("total", 0.0),
-                    "video_clarity": (video or {}).get("clarity_score", 0.0),
-                    "video_sentiment": (video or {}).get("sentiment_score", 0.0),
-                    "text_originality": (text or {}).get("originality_score", 0.0),
-                    "text_feasibility": (text or {}).get("feasibility_score", 0.0),
-                    "code_readability": (code or {}).get("readability_score", 0.0),
-                    "code_documentation": (code or {}).get("documentation_score", 0.0),
-                    "code_test_estimate": (code or {}).get("test_coverage_score_estimate", 0.0),
-                }
-            )
-
-        df = pd.DataFrame(rows)
-        if df.empty:
-            df = pd.DataFrame(
-                columns=[
-                    "rank",
-                    "submission",
-                    "total_score",
-                    "video_clarity",
-                    "video_sentiment",
-                    "text_originality",
-                    "text_feasibility",
-                    "code_readability",
-                    "code_documentation",
-                    "code_test_estimate",
-                ]
-            )
-        else:
-            df.sort_values("total_score", ascending=False, inplace=True)
-            df.reset_index(drop=True, inplace=True)
-            df.insert(0, "rank", df.index + 1)
+        rows = [
+            [entry.get("submission", "unknown")]
+            + [(entry.get(section) or {}).get(key, 0.0) for _, section, key in _LEADERBOARD_METRICS]
+            for entry in submissions
+        ]
+        # Stable sort on total_score (column 1): ties keep submission order.
+        rows.sort(key=lambda row: row[1], reverse=True)
 
-        df.to_csv(leaderboard_path, index=False)
+        with leaderboard_path.open("w", encoding="utf-8", newline="") as handle:
+            writer = csv.writer(handle)
+            writer.writerow(["rank", "submission", *(column for column, _, _ in _LEADERBOARD_METRICS)])
+            writer.writerows([rank, *row] for rank, row in enumerate(rows, start=1))
         return leaderboard_path
 
     @staticmethod
@@ -208,16 +264,56 @@ class ReportGenerator:
         if plt is None:
             return {}
 
-        charts: Dict[str, str] = {}
         target_dir = self._chart_dir(submission_name)
+        manifest_path = target_dir / _CHART_MANIFEST
+        fingerprint = self._chart_fingerprint(score_section, video, text, code)
+        manifest = read_json(manifest_path)
+        if isinstance(manifest, Mapping) and manifest.get("fingerprint") == fingerprint:
+            cached = manifest.get("charts")
+            if isinstance(cached, Mapping) and all(
+                (self.output_dir / str(path)).is_file() for path in cached.values()
+            ):
+                return {str(name): str(path) for name, path in cached.items()}
 
+        charts: Dict[str, str] = {}
         self._plot_scores(target_dir, score_section, charts)
         self._plot_video_metrics(target_dir, video, charts)
         self._plot_text_metrics(target_dir, text, charts)
         self._plot_code_metrics(target_dir, code, charts)
 
+        write_json(manifest_path, {"fingerprint": fingerprint, "charts": charts})
         return charts
 
+    @staticmethod
+    def _chart_fingerprint(
+        score_section: Mapping[str, Any],
+        video: Mapping[str, Any],
+        text: Mapping[str, Any],
+        code: Mapping[str, Any],
+    ) -> str:
+        """Digest of every value the charts draw; unchanged inputs reuse the existing PNGs."""
+        criteria = score_section.get("criteria", {}) if isinstance(score_section, Mapping) else {}
+        inputs = {
+            "style": [_CHART_STYLE_VERSION, _CHART_DPI],
+            # Items, not a dict: bar order follows the criteria order.
+            "criteria": list(criteria.items()) if isinstance(criteria, Mapping) else [],
+            "video": [video.get(key) for key in ("clarity_score", "sentiment_score")] if video else None,
+            "text": [
+                text.get(key)
+                for key in ("originality_score", "feasibility_score", "ai_generated_likelihood")
+            ]
+            if text
+            else None,
+            "code": [
+                code.get(key)
+                for key in ("readability_score", "documentation_score", "test_coverage_score_estimate")
+            ]
+            if code
+            else None,
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
     def _plot_scores(
         self,
         target_dir: Path,
@@ -250,7 +346,7 @@ class ReportGenerator:
         ax.legend()
         fig.tight_layout(rect=[0, 0, 1, 0.95])
         output_path = target_dir / "scores.png"
-        fig.savefig(output_path, dpi=150)
+        fig.savefig(output_path, dpi=_CHART_DPI, metadata=_PNG_METADATA, pil_kwargs=_PNG_OPTIONS)
         plt.close(fig)
         charts["scores"] = self._relative_chart_path(output_path)
 
@@ -274,9 +370,9 @@ class ReportGenerator:
         ax.set_ylim(0, 1)
         ax.set_title("Video Metrics", pad=12)
         ax.bar_label(bars, fmt="%.2f")
-        fig.tight_layout(rect=[0, 0, 1, 0.95])
+        fig.subplots_adjust(**_METRIC_CHART_MARGINS)
         output_path = target_dir / "video_metrics.png"
-        fig.savefig(output_path, dpi=150)
+        fig.savefig(output_path, dpi=_CHART_DPI, metadata=_PNG_METADATA, pil_kwargs=_PNG_OPTIONS)
         plt.close(fig)
         charts["video_metrics"] = self._relative_chart_path(output_path)
 
@@ -308,9 +404,9 @@ class ReportGenerator:
         ax.set_ylim(0, 1)
         ax.set_title("Text Metrics", pad=12)
         ax.bar_label(bars, fmt="%.2f")
-        fig.tight_layout(rect=[0, 0, 1, 0.95])
+        fig.subplots_adjust(**_METRIC_CHART_MARGINS)
         output_path = target_dir / "text_metrics.png"
-        fig.savefig(output_path, dpi=150)
+        fig.savefig(output_path, dpi=_CHART_DPI, metadata=_PNG_METADATA, pil_kwargs=_PNG_OPTIONS)
         plt.close(fig)
         charts["text_metrics"] = self._relative_chart_path(output_path)
 
@@ -342,9 +438,9 @@ class ReportGenerator:
         ax.set_ylim(0, 1)
         ax.set_title("Code Metrics", pad=12)
         ax.bar_label(bars, fmt="%.2f")
-        fig.tight_layout(rect=[0, 0, 1, 0.95])
+        fig.subplots_adjust(**_METRIC_CHART_MARGINS)
         output_path = target_dir / "code_metrics.png"
-        fig.savefig(output_path, dpi=150)
+        fig.savefig(output_path, dpi=_CHART_DPI, metadata=_PNG_METADATA, pil_kwargs=_PNG_OPTIONS)
         plt.close(fig)
         charts["code_metrics"] = self._relative_chart_path(output_path)
 
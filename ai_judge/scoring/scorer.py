@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from typing import Any, Dict, Mapping
 
 from ..modules.code_analyzer import CodeAnalysisResult
@@ -9,6 +11,12 @@ from ..modules.video_analyzer import VideoAnalysisResult
 from .criteria import Criterion, JudgingCriteria
 
 
+@lru_cache(maxsize=None)
+def _metric_path(source: str) -> tuple[str, ...]:
+    """Dotted metric source split once per distinct path."""
+    return tuple(source.split("."))
+
+
 @dataclass(frozen=True)
 class ScoreBreakdown:
     """Normalized scores produced by the judging pipeline."""
@@ -20,6 +28,16 @@ class ScoreBreakdown:
         return {item.key: item for item in self.criteria}
 
     def as_dict(self) -> Dict[str, Any]:
+        """Serialized breakdown as plain (JSON-friendly) dicts, copied from the cached payload."""
+        serialized = self._serialized
+        return {
+            "total": serialized["total"],
+            "criteria": {key: dict(entry) for key, entry in serialized["criteria"].items()},
+        }
+
+    @cached_property
+    def _serialized(self) -> Dict[str, Any]:
+        # Frozen, so the payload is built once; cached_property writes to __dict__ directly.
         return {
             "total": round(self.total, 3),
             "criteria": {
@@ -32,7 +50,8 @@ class ScoreBreakdown:
                     "weighted_score": item.weighted_score,
                     "description": item.description,
                 }
-                for item in self.criteria
+                # Heaviest first, the order reports present them in.
+                for item in sorted(self.criteria, key=lambda item: item.normalized_weight, reverse=True)
             },
         }
 
@@ -56,6 +75,7 @@ class Scorer:
 
     def __init__(self, criteria: JudgingCriteria | None = None) -> None:
         self.criteria = criteria or JudgingCriteria.default()
+        self._weights: tuple[JudgingCriteria, tuple[float, ...]] | None = None
 
     def score(
         self,
@@ -72,33 +92,43 @@ class Scorer:
         if extra_metrics:
             context.update(extra_metrics)
 
-        normalized_weights = self.criteria.normalized_weights()
-        criterion_scores: list[CriterionScore] = []
-        total_score = 0.0
-
-        for idx, criterion in enumerate(self.criteria.criteria):
-            raw_value = self._resolve_metric(criterion, context)
-            normalized_value = criterion.clamp(float(raw_value))
-            normalized_weight = normalized_weights[idx]
-            weighted_score = normalized_value * normalized_weight
-            total_score += weighted_score
-            criterion_scores.append(
-                CriterionScore(
-                    key=criterion.key,
-                    label=criterion.label,
-                    raw_value=round(float(raw_value), 3),
-                    normalized_value=round(normalized_value, 3),
-                    weight=round(criterion.weight, 3),
-                    normalized_weight=round(normalized_weight, 3),
-                    weighted_score=round(weighted_score, 3),
-                    description=criterion.description,
-                )
+        normalized_weights = self._normalized_weights()
+        raw_values = [self._resolve_metric(criterion, context) for criterion in self.criteria.criteria]
+        normalized_values = [
+            criterion.clamp(float(raw_value))
+            for criterion, raw_value in zip(self.criteria.criteria, raw_values)
+        ]
+        weighted_scores = [
+            value * weight for value, weight in zip(normalized_values, normalized_weights)
+        ]
+        criterion_scores = tuple(
+            CriterionScore(
+                key=criterion.key,
+                label=criterion.label,
+                raw_value=round(float(raw_value), 3),
+                normalized_value=round(normalized_value, 3),
+                weight=round(criterion.weight, 3),
+                normalized_weight=round(normalized_weight, 3),
+                weighted_score=round(weighted_score, 3),
+                description=criterion.description,
+            )
+            for criterion, raw_value, normalized_value, normalized_weight, weighted_score in zip(
+                self.criteria.criteria, raw_values, normalized_values, normalized_weights, weighted_scores
             )
+        )
+        # Exactly rounded sum of the unrounded contributions.
+        total_score = math.fsum(weighted_scores)
+
+        return ScoreBreakdown(criteria=criterion_scores, total=round(total_score, 3))
 
-        return ScoreBreakdown(criteria=tuple(criterion_scores), total=round(total_score, 3))
+    def _normalized_weights(self) -> tuple[float, ...]:
+        """Weights normalized once per criteria set (recomputed if ``criteria`` is replaced)."""
+        if self._weights is None or self._weights[0] is not self.criteria:
+            self._weights = (self.criteria, self.criteria.normalized_weights())
+        return self._weights[1]
 
     def _resolve_metric(self, criterion: Criterion, context: Mapping[str, Any]) -> float:
-        parts = criterion.source.split(".")
+        parts = _metric_path(criterion.source)
         if not parts:
             raise ValueError(f"Invalid metric source for criterion '{criterion.key}'.")
 
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import hashlib
+import shutil
+import time
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
 from typing import Any, Mapping
@@ -45,14 +48,43 @@ class AnalysisCache:
             return
 
         submission_dir = self.base_dir / submission
-        if not submission_dir.exists():
-            return
+        # Never let an empty or relative name ("", "..") widen the delete beyond one submission.
+        if submission_dir.resolve().parent != self.base_dir.resolve():
+            raise ValueError(f"Invalid submission name for cache invalidation: {submission!r}")
+        shutil.rmtree(submission_dir, ignore_errors=True)
+
+
+class ResponseCache:
+    """JSON memo for remote calls (LLM prompts, web searches) keyed by content hash."""
+
+    def __init__(self, base_dir: Path, ttl_seconds: float | None = 7 * 24 * 3600) -> None:
+        self.base_dir = Path(base_dir)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def key(*parts: object) -> str:
+        """Stable digest of the call inputs."""
+        digest = hashlib.blake2b(digest_size=20)
+        for part in parts:
+            digest.update(str(part).encode("utf-8"))
+            digest.update(b"\x1f")
+        return digest.hexdigest()
 
-        for payload_file in submission_dir.glob("*.json"):
-            payload_file.unlink(missing_ok=True)
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        return self.base_dir / namespace / key[:2] / f"{key}.json"
+
+    def get(self, namespace: str, key: str) -> Any | None:
+        """Return the stored value, or ``None`` when missing or expired."""
+        data = read_json(self._entry_path(namespace, key))
+        if not isinstance(data, Mapping):
+            return None
+        created = data.get("created")
+        if self.ttl_seconds is not None and (
+            not isinstance(created, (int, float)) or time.time() - created > self.ttl_seconds
+        ):
+            return None
+        return data.get("value")
 
-        try:
-            submission_dir.rmdir()
-        except OSError:
-            # Directory may still contain other files; ignore.
-            pass
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value."""
+        write_json(self._entry_path(namespace, key), {"created": time.time(), "value": value})
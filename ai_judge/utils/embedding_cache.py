@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Mapping
+
+from .file_helpers import ensure_directory, read_json, write_json
+
+try:  # pragma: no cover - optional heavy dependencies
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    np = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    import faiss  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    faiss = None  # type: ignore
+
+
+class CorpusEmbeddingCache:
+    """On-disk store for a similarity corpus embedding matrix and its FAISS index.
+
+    Entries live under a directory keyed by the encoder identity. ``meta.json`` is
+    written last and acts as the commit marker, so a half-written entry is ignored.
+    """
+
+    MATRIX_FILE = "corpus.npy"
+    INDEX_FILE = "corpus.faiss"
+    META_FILE = "meta.json"
+
+    def __init__(self, base_dir: Path, model_key: str) -> None:
+        slug = hashlib.blake2b(model_key.encode("utf-8"), digest_size=8).hexdigest()
+        self.base_dir = Path(base_dir) / slug
+        self._model_key = model_key
+
+    def load(self, fingerprint: str) -> tuple[Any, Any | None] | None:
+        """Return ``(matrix, index)`` if the stored entry matches ``fingerprint``."""
+        if np is None:
+            return None
+        meta = read_json(self.base_dir / self.META_FILE)
+        if not isinstance(meta, Mapping):
+            return None
+        if meta.get("model") != self._model_key or meta.get("fingerprint") != fingerprint:
+            return None
+        try:
+            matrix = np.load(self.base_dir / self.MATRIX_FILE, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        if matrix.ndim != 2 or matrix.shape != (meta.get("count"), meta.get("dim")):
+            return None
+        index = None
+        index_path = self.base_dir / self.INDEX_FILE
+        if faiss is not None and meta.get("has_index") and index_path.exists():
+            try:
+                index = faiss.read_index(str(index_path))
+            except Exception:  # pragma: no cover - depends on faiss build
+                index = None
+        return matrix, index
+
+    def store(self, fingerprint: str, matrix: Any, index: Any | None = None) -> None:
+        """Persist ``matrix`` (and ``index`` when given) for ``fingerprint``."""
+        if np is None:
+            return
+        ensure_directory(self.base_dir)
+        (self.base_dir / self.META_FILE).unlink(missing_ok=True)
+        np.save(self.base_dir / self.MATRIX_FILE, matrix)
+        has_index = False
+        if index is not None and faiss is not None:
+            faiss.write_index(index, str(self.base_dir / self.INDEX_FILE))
+            has_index = True
+        write_json(
+            self.base_dir / self.META_FILE,
+            {
+                "model": self._model_key,
+                "fingerprint": fingerprint,
+                "count": int(matrix.shape[0]),
+                "dim": int(matrix.shape[1]),
+                "dtype": str(matrix.dtype),
+                "has_index": has_index,
+            },
+        )
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import logging
+import os
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Protocol, Sequence
+
+try:  # pragma: no cover - optional heavy dependencies
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    np = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    import torch  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    torch = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    from sentence_transformers import SentenceTransformer  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    SentenceTransformer = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    import onnxruntime as ort  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    ort = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    from transformers import AutoTokenizer  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    AutoTokenizer = None  # type: ignore
+
+try:  # pragma: no cover - optional heavy dependencies
+    from transformers import AutoConfig, AutoModel, AutoModelForSequenceClassification  # type: ignore
+except ImportError:  # pragma: no cover - optional heavy dependencies
+    AutoConfig = AutoModel = AutoModelForSequenceClassification = None  # type: ignore
+
+LOGGER = logging.getLogger(__name__)
+
+PRECISIONS = ("fp32", "fp16", "bf16")
+
+
+def _inference_mode() -> Any:
+    if torch is not None and hasattr(torch, "inference_mode"):
+        return torch.inference_mode()
+    return nullcontext()
+
+
+def onnx_export_available() -> bool:
+    return (
+        ort is not None
+        and torch is not None
+        and AutoTokenizer is not None
+        and AutoModel is not None
+        and np is not None
+    )
+
+
+def export_onnx(
+    model_name: str, path: Path, sequence_classification: bool = False, opset: int = 17
+) -> Path:  # pragma: no cover - depends on optional libs
+    """Export a Hugging Face encoder (or sequence classifier) to ``path`` once.
+
+    The graph has dynamic batch and sequence axes; an existing file is reused as-is.
+    """
+    if path.exists():
+        return path
+    if not onnx_export_available():
+        raise RuntimeError("torch, transformers and onnxruntime are required for ONNX export.")
+    tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+    model_cls = AutoModelForSequenceClassification if sequence_classification else AutoModel
+    model = model_cls.from_pretrained(model_name).eval()
+    sample = tokenizer(["onnx export sample"], return_tensors="pt")
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["output"] = {0: "batch"} if sequence_classification else {0: "batch", 1: "sequence"}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            tuple(sample[name] for name in input_names),
+            str(partial),
+            input_names=input_names,
+            output_names=["output"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+        )
+    partial.replace(path)
+    LOGGER.info("Exported %s to ONNX at %s", model_name, path)
+    return path
+
+
+def quantize_onnx_int8(path: Path) -> Path:  # pragma: no cover - depends on optional libs
+    """Dynamically quantize the weights of ``path`` to INT8, next to it, once.
+
+    Activations stay in float and are quantized per batch at runtime, so no
+    calibration data is needed; an existing quantized file is reused as-is.
+    """
+    target = path.with_name(f"{path.stem}.int8.onnx")
+    if target.exists():
+        return target
+    if ort is None:
+        raise RuntimeError("onnxruntime is required for INT8 quantization.")
+    from onnxruntime.quantization import QuantType, quantize_dynamic  # type: ignore
+
+    partial = target.with_name(target.name + ".partial")
+    quantize_dynamic(str(path), str(partial), weight_type=QuantType.QInt8, per_channel=True)
+    partial.replace(target)
+    LOGGER.info("Quantized %s to INT8 at %s", path, target)
+    return target
+
+
+def create_onnx_session(onnx_model_path: Path) -> Any:
+    """ONNX Runtime session with full graph optimizations, preferring CUDA when present."""
+    options = ort.SessionOptions()
+    options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    options.intra_op_num_threads = os.cpu_count() or 1
+    available = set(ort.get_available_providers())
+    providers = [
+        provider
+        for provider in ("CUDAExecutionProvider", "CPUExecutionProvider")
+        if provider in available
+    ]
+    return ort.InferenceSession(str(onnx_model_path), sess_options=options, providers=providers)
+
+
+class TextEncoder(Protocol):
+    """Encodes texts into L2-normalized embedding rows."""
+
+    def encode(self, texts: Sequence[str]) -> Any:
+        ...
+
+
+class SentenceTransformerEncoder:
+    """Default encoder backed by the stock sentence-transformers pipeline.
+
+    ``precision`` of ``"fp16"``/``"bf16"`` casts the model weights on CUDA devices only;
+    half precision is not faster on CPU, so other devices stay in FP32.
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str | None = None,
+        batch_size: int = 64,
+        precision: str = "fp32",
+    ) -> None:
+        if SentenceTransformer is None:
+            raise RuntimeError("sentence-transformers is not installed.")
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unsupported precision '{precision}'; expected one of {PRECISIONS}.")
+        kwargs: dict[str, object] = {}
+        if device is not None:
+            kwargs["device"] = device
+        self._model = SentenceTransformer(model_name, **kwargs)
+        self._batch_size = max(1, batch_size)
+        if precision != "fp32":
+            if device is not None and device.startswith("cuda"):
+                if precision == "bf16" and not torch.cuda.is_bf16_supported():
+                    precision = "fp16"  # pre-Ampere GPUs lack native bf16
+                self._model = self._model.half() if precision == "fp16" else self._model.bfloat16()
+            else:
+                LOGGER.debug("Keeping %s in fp32 on device %s", model_name, device or "default")
+
+    def encode(self, texts: Sequence[str]) -> Any:
+        with _inference_mode():
+            return self._model.encode(
+                list(texts),
+                batch_size=self._batch_size,
+                normalize_embeddings=True,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+
+
+class OnnxEncoder:
+    """Encoder running an exported (optionally INT8-quantized) model via ONNX Runtime.
+
+    Token embeddings are mean-pooled with the attention mask and L2-normalized so
+    the output is interchangeable with :class:`SentenceTransformerEncoder`. Texts are
+    batched in length order so each batch pads only to its own longest member.
+    """
+
+    def __init__(
+        self,
+        onnx_model_path: Path,
+        tokenizer_name: str,
+        batch_size: int = 32,
+        max_length: int = 512,
+    ) -> None:
+        if ort is None or AutoTokenizer is None or np is None:
+            raise RuntimeError("onnxruntime, transformers and numpy are required for ONNX encoding.")
+        self._session = create_onnx_session(onnx_model_path)
+        self._input_names = {item.name for item in self._session.get_inputs()}
+        self._tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, use_fast=True)
+        self._batch_size = max(1, batch_size)
+        self._max_length = max_length
+
+    def encode(self, texts: Sequence[str]) -> Any:
+        batches = []
+        items = list(texts)
+        order = sorted(range(len(items)), key=lambda idx: len(items[idx]))
+        for start in range(0, len(order), self._batch_size):
+            batch = [items[idx] for idx in order[start : start + self._batch_size]]
+            encoded = self._tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self._max_length,
+                return_tensors="np",
+            )
+            feeds = {name: value for name, value in encoded.items() if name in self._input_names}
+            token_embeddings = self._session.run(None, feeds)[0]
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            summed = (token_embeddings * mask).sum(axis=1)
+            vectors = summed / np.clip(mask.sum(axis=1), 1e-9, None)
+            vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+            batches.append(vectors.astype(np.float32))
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        vectors = np.empty((len(items), batches[0].shape[1]), dtype=np.float32)
+        vectors[order] = np.vstack(batches)
+        return vectors
+
+
+class OnnxSequenceClassifier:
+    """Text classifier running an exported sequence-classification model via ONNX Runtime."""
+
+    def __init__(self, onnx_model_path: Path, model_name: str, max_length: int = 512) -> None:
+        if ort is None or AutoTokenizer is None or AutoConfig is None or np is None:
+            raise RuntimeError("onnxruntime, transformers and numpy are required for ONNX inference.")
+        self._session = create_onnx_session(onnx_model_path)
+        self._input_names = {item.name for item in self._session.get_inputs()}
+        self._tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+        self._max_length = min(max_length, self._tokenizer.model_max_length)
+        self.id2label = dict(AutoConfig.from_pretrained(model_name).id2label)
+
+    def predict(self, text: str) -> list[tuple[str, float]]:
+        """Return ``(label, probability)`` pairs for ``text``."""
+        return self.predict_batch([text])[0]
+
+    def predict_batch(self, texts: Sequence[str]) -> list[list[tuple[str, float]]]:
+        """:meth:`predict` for several texts in one padded session run."""
+        if not texts:
+            return []
+        encoded = self._tokenizer(
+            list(texts), padding=True, truncation=True, max_length=self._max_length, return_tensors="np"
+        )
+        feeds = {name: value for name, value in encoded.items() if name in self._input_names}
+        logits = self._session.run(None, feeds)[0].astype(np.float64)
+        probs = np.exp(logits - logits.max(axis=1, keepdims=True))
+        probs /= probs.sum(axis=1, keepdims=True)
+        labels = [str(self.id2label.get(index, index)) for index in range(probs.shape[1])]
+        return [list(zip(labels, row.tolist())) for row in probs]
@@ -3,6 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Iterable, List, Sequence, Tuple
 
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore
+
 
 @dataclass(frozen=True)
 class BinaryEvalResult:
@@ -40,26 +45,36 @@ def evaluate_binary(
         ValueError: if the inputs are empty or of mismatched lengths.
     """
 
-    labels = list(int(label) for label in y_true)
-    scores = list(float(score) for score in y_scores)
-    if not labels:
+    if np is not None:
+        labels, scores = _as_arrays(y_true, y_scores)
+    else:
+        labels = list(int(label) for label in y_true)
+        scores = list(float(score) for score in y_scores)
+    if not len(labels):
         raise ValueError("Inputs must not be empty.")
     if len(labels) != len(scores):
         raise ValueError("Labels and scores must have the same length.")
-    if any(label not in (0, 1) for label in labels):
+    if np is not None:
+        if np.any((labels != 0) & (labels != 1)):
+            raise ValueError("Labels must be binary (0 or 1).")
+    elif any(label not in (0, 1) for label in labels):
         raise ValueError("Labels must be binary (0 or 1).")
 
-    positives = sum(labels)
+    positives = int(sum(labels)) if np is None else int(labels.sum())
     negatives = len(labels) - positives
     degenerate = positives == 0 or negatives == 0
 
-    roc_curve = _roc_curve(labels, scores)
-    auroc = None if degenerate else _area_under_curve(roc_curve)
-
-    pr_curve = _precision_recall_curve(labels, scores)
-    precision, recall, f1 = _summary_at_threshold(labels, scores, threshold)
-
-    fpr_target = None if degenerate else _fpr_at_target_tpr(labels, scores, target_tpr)
+    if np is not None:
+        roc_curve, pr_curve, auroc, fpr_target, counts = _evaluate_vectorized(
+            labels, scores, threshold, target_tpr
+        )
+        precision, recall, f1 = _summary_from_counts(*counts)
+    else:
+        roc_curve = _roc_curve(labels, scores)
+        auroc = None if degenerate else _area_under_curve(roc_curve)
+        pr_curve = _precision_recall_curve(labels, scores)
+        precision, recall, f1 = _summary_at_threshold(labels, scores, threshold)
+        fpr_target = None if degenerate else _fpr_at_target_tpr(labels, scores, target_tpr)
 
     return BinaryEvalResult(
         auroc=auroc,
@@ -74,6 +89,78 @@ def evaluate_binary(
     )
 
 
+def _as_arrays(y_true: Iterable[int], y_scores: Iterable[float]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Coerce inputs like ``int()`` / ``float()`` would; NumPy arrays convert without a Python round trip."""
+    if isinstance(y_true, np.ndarray):
+        labels = y_true.astype(np.int64, copy=False)
+    else:
+        labels = np.fromiter((int(label) for label in y_true), dtype=np.int64)
+    if isinstance(y_scores, np.ndarray):
+        scores = y_scores.astype(np.float64, copy=False)
+    else:
+        scores = np.fromiter((float(score) for score in y_scores), dtype=np.float64)
+    return labels, scores
+
+
+def _evaluate_vectorized(
+    labels: Sequence[int], scores: Sequence[float], threshold: float, target_tpr: float
+) -> Tuple[
+    List[Tuple[float, float]],
+    List[Tuple[float, float]],
+    float | None,
+    float | None,
+    Tuple[int, int, int],
+]:
+    """NumPy equivalent of the pure-Python curve helpers, sharing one stable sort.
+
+    Returns ROC points, PR points, AUROC, FPR@target and the (tp, fp, fn) counts at
+    ``threshold``; the points match :func:`_roc_curve` / :func:`_precision_recall_curve`.
+    """
+    y = np.asarray(labels, dtype=np.int64)
+    s = np.asarray(scores, dtype=np.float64)
+    count = len(y)
+
+    predicted = s >= threshold
+    true_positive = int(np.count_nonzero(predicted & (y == 1)))
+    counts = (
+        true_positive,
+        int(np.count_nonzero(predicted)) - true_positive,
+        int(y.sum()) - true_positive,
+    )
+
+    # Stable descending order, so tied scores keep input order like sorted(reverse=True).
+    order = np.argsort(-s, kind="stable")
+    ranked = s[order]
+    tp = np.cumsum(y[order])
+    fp = np.arange(1, count + 1) - tp
+    positives = int(tp[-1])
+    negatives = count - positives
+
+    if positives == 0:
+        pr_curve = [(1.0, 0.0)]
+    else:
+        recall = (tp / positives).tolist()
+        precision = (tp / np.arange(1, count + 1)).tolist()
+        pr_curve = [(0.0, 1.0), *zip(recall, precision)]
+
+    if positives == 0 or negatives == 0:
+        return [(0.0, 0.0), (1.0, 1.0)], pr_curve, None, None, counts
+
+    # A ROC point is emitted before every change of score, then the (1, 1) corner.
+    cuts = np.flatnonzero(ranked[1:] != ranked[:-1])
+    fpr = np.concatenate(([0.0], fp[cuts] / negatives, [1.0]))
+    tpr = np.concatenate(([0.0], tp[cuts] / positives, [1.0]))
+    widths = np.maximum(np.diff(fpr), 0.0)
+    auroc = round(float(np.sum(widths * (tpr[:-1] + tpr[1:]) / 2)), 6)
+
+    reached = np.flatnonzero(tp / positives >= target_tpr)
+    # FPR only grows down the ranking, so the first index reaching the target is the minimum.
+    fpr_target = round(float(fp[reached[0]] / negatives), 6) if reached.size else None
+
+    roc_curve = list(zip(fpr.tolist(), tpr.tolist()))
+    return roc_curve, pr_curve, auroc, fpr_target, counts
+
+
 def _roc_curve(labels: Sequence[int], scores: Sequence[float]) -> List[Tuple[float, float]]:
     positives = sum(labels)
     negatives = len(labels) - positives
@@ -143,6 +230,12 @@ def _summary_at_threshold(
             tn += 1
         else:
             fn += 1
+    return _summary_from_counts(tp, fp, fn)
+
+
+def _summary_from_counts(
+    tp: int, fp: int, fn: int
+) -> Tuple[float | None, float | None, float | None]:
     precision = tp / (tp + fp) if (tp + fp) > 0 else None
     recall = tp / (tp + fn) if (tp + fn) > 0 else None
     if precision is None or recall is None or (precision + recall) == 0:
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import codecs
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, NamedTuple, Optional
 
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional faster JSON codec
+    orjson = None  # type: ignore
+
 
 def ensure_directory(path: Path) -> Path:
     """Create the directory if missing and return the Path."""
@@ -11,61 +19,141 @@ def ensure_directory(path: Path) -> Path:
     return path
 
 
+def _decode_text(path: str | Path) -> str:
+    """``Path.read_text(encoding="utf-8")`` without the TextIOWrapper layer.
+
+    Reads bytes and decodes once; newlines are normalised like universal-newline
+    mode, but only when the file actually contains a carriage return.
+    """
+    with open(path, "rb") as handle:
+        text = handle.read().decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def read_text(path: Path, default: str = "") -> str:
     """Read UTF-8 text from a file, returning a default value if it does not exist."""
     try:
-        return path.read_text(encoding="utf-8")
+        return _decode_text(path)
     except FileNotFoundError:
         return default
 
 
+def read_text_prefix(path: Path, max_bytes: int, default: str = "") -> str:
+    """Read at most ``max_bytes`` of UTF-8 text; a character split at the cut is dropped.
+
+    Decoding is otherwise strict, like :func:`read_text`: invalid bytes raise.
+    """
+    try:
+        with path.open("rb") as handle:
+            data = handle.read(max_bytes)
+    except FileNotFoundError:
+        return default
+    # A non-final incremental decode holds back only an incomplete trailing sequence.
+    return codecs.getincrementaldecoder("utf-8")().decode(data, final=len(data) < max_bytes)
+
+
 def write_json(path: Path, payload: Any) -> None:
     """Write a JSON file with pretty formatting, ensuring the parent directory exists."""
     ensure_directory(path.parent)
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    if orjson is not None:
+        # Same layout as json's indent=2 without its pure-Python pretty printer.
+        path.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        return
+    path.write_bytes(json.dumps(payload, indent=2, ensure_ascii=False).encode("utf-8"))
 
 
 def read_json(path: Path) -> Optional[Any]:
     """Read JSON content from a file, returning None if it does not exist or is invalid."""
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        data = path.read_bytes()
+        # Both decoders parse UTF-8 bytes directly; no intermediate str copy of the file.
+        return orjson.loads(data) if orjson is not None else json.loads(data)
     except FileNotFoundError:
         return None
     except json.JSONDecodeError:
         return None
 
 
+@lru_cache(maxsize=64)
+def _read_text_snapshot(path: str, mtime_ns: int, size: int) -> str:
+    # Keyed on mtime/size so an edited file is re-read without explicit invalidation.
+    return _decode_text(path)
+
+
+def read_text_shared(path: Path, default: str = "") -> str:
+    """Like :func:`read_text`, but repeated reads of an unchanged file share one decode.
+
+    The video and text analyzers both fall back to the same description file, so
+    the second reader only pays for a ``stat``.
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return default
+    try:
+        return _read_text_snapshot(str(path), stat.st_mtime_ns, stat.st_size)
+    except FileNotFoundError:
+        return default
+
+
 class SubmissionDescription(NamedTuple):
     text: str
     source: str
 
 
+# Case-folded candidate names in preference order.
+_DESCRIPTION_CANDIDATES = (
+    ("description.txt", "description_fallback"),
+    ("description.md", "description_fallback"),
+    ("readme.md", "readme_fallback"),
+    ("readme.txt", "readme_fallback"),
+)
+
+
+@lru_cache(maxsize=128)
+def _description_candidates(submission_dir: str, mtime_ns: int) -> tuple[tuple[str, str], ...]:
+    """Candidate ``(path, label)`` pairs in preference order for one directory snapshot.
+
+    Keyed on the directory mtime, which changes whenever an entry is added, removed
+    or renamed; edits to a file's content are caught by :func:`read_text_shared`.
+    """
+    # One directory scan instead of a failed open per absent candidate.
+    found: dict[str, list[str]] = {}
+    try:
+        with os.scandir(submission_dir) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    found.setdefault(entry.name.lower(), []).append(entry.path)
+    except OSError:
+        return ()
+    return tuple(
+        (path, label)
+        for filename, label in _DESCRIPTION_CANDIDATES
+        for path in sorted(found.get(filename, ()))
+    )
+
+
 def read_submission_description(submission_dir: Path) -> SubmissionDescription:
     """Return the best available textual description for a submission.
 
-    Preference order:
-        1. description.txt / DESCRIPTION.txt
-        2. description.md / DESCRIPTION.md
+    Preference order (file names match case-insensitively):
+        1. description.txt
+        2. description.md
         3. README files (md/txt variants)
 
     The returned source string indicates which file supplied the content or
     'missing' if none were found.
     """
 
-    candidates = [
-        ("description.txt", "description_fallback"),
-        ("DESCRIPTION.TXT", "description_fallback"),
-        ("description.md", "description_fallback"),
-        ("DESCRIPTION.MD", "description_fallback"),
-        ("README.md", "readme_fallback"),
-        ("readme.md", "readme_fallback"),
-        ("README.MD", "readme_fallback"),
-        ("README.txt", "readme_fallback"),
-        ("readme.txt", "readme_fallback"),
-    ]
-
-    for filename, label in candidates:
-        content = read_text(submission_dir / filename)
+    try:
+        mtime_ns = os.stat(submission_dir).st_mtime_ns
+    except OSError:
+        return SubmissionDescription("", "missing")
+
+    for path, label in _description_candidates(os.fspath(submission_dir), mtime_ns):
+        content = read_text_shared(Path(path))
         if content.strip():
             return SubmissionDescription(content, label)
 
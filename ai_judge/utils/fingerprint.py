@@ -1,33 +1,107 @@
 from __future__ import annotations
 
 import hashlib
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
 
 IGNORED_DIRECTORIES = {"__pycache__"}
 IGNORED_SUFFIXES = {".pyc", ".pyo", ".log", ".tmp"}
+_IGNORED_SUFFIX_TUPLE = tuple(IGNORED_SUFFIXES)
 
+# Below this many files a thread pool costs more than the stat calls it overlaps.
+_PARALLEL_STAT_THRESHOLD = 256
+_STAT_WORKERS = min(16, (os.cpu_count() or 1) * 2)
+# mtime_ns (signed) and size as fixed-width little-endian integers.
+_pack_stat = struct.Struct("<qQ").pack
 
-def directory_fingerprint(root: Path, include_suffixes: Iterable[str] | None = None) -> str:
-    """Compute a deterministic fingerprint for files under ``root``."""
-    include = set(include_suffixes or [])
-    digest = hashlib.sha1()
 
-    for path in sorted(root.rglob("*")):
-        if path.is_dir():
-            if path.name in IGNORED_DIRECTORIES:
+def _scan_files(directory: str, prefix: str) -> Iterator[tuple[str, os.DirEntry]]:
+    """Yield ``(relative path, entry)`` for every non-directory below ``directory``.
+
+    Entries are visited depth-first in name order, which is exactly the order of
+    ``sorted(root.rglob("*"))``, so no global sort is needed. Symlinked directories
+    are not followed; ignored directories are pruned.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            children = sorted(entries, key=_entry_name)
+    except OSError:
+        return
+    for entry in children:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in IGNORED_DIRECTORIES:
+                    yield from _scan_files(entry.path, f"{prefix}{entry.name}{os.sep}")
                 continue
+            if entry.is_dir():
+                continue  # symlink to a directory
+        except OSError:
             continue
-        if include and path.suffix not in include:
+        yield prefix + entry.name, entry
+
+
+def _entry_name(entry: os.DirEntry) -> str:
+    return entry.name
+
+
+def _stat(entry: os.DirEntry) -> os.stat_result | None:
+    try:
+        return entry.stat()
+    except OSError:
+        return None
+
+
+def _stat_all(entries: list[os.DirEntry]) -> list[os.stat_result | None]:
+    return [_stat(entry) for entry in entries]
+
+
+def file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """BLAKE2b hash of a file's full contents (identifies content; no security role)."""
+    digest = hashlib.blake2b(digest_size=16)
+    with path.open("rb") as handle:
+        while True:
+            chunk = handle.read(chunk_size)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def directory_fingerprint(root: Path, include_suffixes: Iterable[str] | None = None) -> str:
+    """Compute a deterministic fingerprint for files under ``root``."""
+    include = tuple(include_suffixes or ())
+    digest = hashlib.blake2b(digest_size=16)
+
+    # One scandir pass; DirEntry caches the type, leaving a single stat per file.
+    selected = []
+    for rel, entry in _scan_files(os.fspath(root), ""):
+        # str.endswith(tuple) checks every suffix in one C call, no slicing per file.
+        name = entry.name
+        if include and not name.endswith(include):
             continue
-        if path.suffix in IGNORED_SUFFIXES:
+        if name.endswith(_IGNORED_SUFFIX_TUPLE):
             continue
-        try:
-            stat = path.stat()
-        except OSError:
+        selected.append((rel, entry))
+
+    # stat releases the GIL, so on large trees (or slow storage) overlap the calls in
+    # one contiguous slice per worker; map preserves order for the serial digest.
+    if len(selected) >= _PARALLEL_STAT_THRESHOLD:
+        entries = [entry for _, entry in selected]
+        size = -(-len(entries) // _STAT_WORKERS)
+        with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as pool:
+            chunks = pool.map(_stat_all, (entries[i : i + size] for i in range(0, len(entries), size)))
+            stats = [stat for chunk in chunks for stat in chunk]
+    else:
+        stats = _stat_all([entry for _, entry in selected])
+
+    for (rel, _), stat in zip(selected, stats):
+        if stat is None:
             continue
-        digest.update(str(path.relative_to(root)).encode("utf-8"))
-        digest.update(str(stat.st_mtime_ns).encode("utf-8"))
-        digest.update(str(stat.st_size).encode("utf-8"))
+        # One record per file: NUL-terminated path (fsencode round-trips undecodable
+        # names) then the packed stat fields, with no int-to-text conversion.
+        digest.update(os.fsencode(rel) + b"\0" + _pack_stat(stat.st_mtime_ns, stat.st_size))
 
     return digest.hexdigest()
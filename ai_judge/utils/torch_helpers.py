@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import logging
+import os
+import threading
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Union
 
+LOGGER = logging.getLogger(__name__)
+
+_THREADS_LOCK = threading.Lock()
+_THREADS_CONFIGURED = False
+
 
 @dataclass(frozen=True)
 class DeviceSpec:
@@ -28,6 +37,7 @@ class DeviceSpec:
         return self.kind in {"cuda", "mps"}
 
 
+@lru_cache(maxsize=1)
 def _import_torch():  # pragma: no cover - optional dependency
     try:
         import torch  # type: ignore
@@ -37,6 +47,39 @@ def _import_torch():  # pragma: no cover - optional dependency
         return None
 
 
+def available_cpu_count() -> int:
+    """Cores this process may run on (respects CPU affinity, e.g. container limits)."""
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # pragma: no cover - not available on macOS/Windows
+        return os.cpu_count() or 1
+
+
+def configure_cpu_threads(num_threads: int | None = None) -> bool:
+    """Size torch's CPU thread pools once per process.
+
+    Intra-op parallelism is set to ``num_threads`` (default: all usable cores) and
+    inter-op parallelism to a single thread. Returns ``True`` only on the call that
+    applied the settings.
+    """
+    global _THREADS_CONFIGURED
+    torch = _import_torch()
+    if torch is None:
+        return False
+    with _THREADS_LOCK:
+        if _THREADS_CONFIGURED:
+            return False
+        _THREADS_CONFIGURED = True
+        threads = max(1, num_threads or available_cpu_count())
+        torch.set_num_threads(threads)
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError as exc:  # raised once inter-op work has already started
+            LOGGER.debug("Could not change torch inter-op threads: %s", exc)
+        LOGGER.debug("Torch CPU threads set to %d", threads)
+        return True
+
+
 def resolve_device_spec(preference: str | None = "auto") -> DeviceSpec:
     """Resolve a device preference into concrete execution targets.
 
@@ -55,21 +98,40 @@ def resolve_device_spec(preference: str | None = "auto") -> DeviceSpec:
         or a device string).
     """
 
+    return _resolve_device_spec((preference or "auto").lower().strip())
+
+
+@lru_cache(maxsize=1)
+def _probe_backends() -> tuple[bool, int, bool]:
+    """``(has_cuda, cuda_count, has_mps)``, queried from torch once per process."""
     torch = _import_torch()
-    pref = (preference or "auto").lower().strip()
+    if torch is None:
+        return False, 0, False
 
-    has_cuda = bool(torch and getattr(torch.cuda, "is_available", lambda: False)())
-    cuda_count = int(torch.cuda.device_count()) if torch and has_cuda else 0
+    # CPU-only wheels ship without a CUDA (or ROCm/HIP) runtime; skip the driver query there.
+    version = getattr(torch, "version", None)
+    gpu_build = getattr(version, "cuda", None) is not None or getattr(version, "hip", None) is not None
+    has_cuda = gpu_build and bool(getattr(torch.cuda, "is_available", lambda: False)())
+    cuda_count = int(torch.cuda.device_count()) if has_cuda else 0
+
+    # Only ask for MPS on builds that include it.
+    mps = getattr(torch.backends, "mps", None)
     has_mps = bool(
-        torch
-        and getattr(torch.backends, "mps", None) is not None
-        and torch.backends.mps.is_available()
+        mps is not None
+        and getattr(mps, "is_built", lambda: True)()
+        and mps.is_available()
     )
+    return has_cuda, cuda_count, has_mps
+
 
-    # Explicit CPU request or no torch backend available.
-    if pref in {"cpu", "none"} or torch is None:
+@lru_cache(maxsize=16)
+def _resolve_device_spec(pref: str) -> DeviceSpec:
+    # Explicit CPU request or no torch backend available; neither needs a device probe.
+    if pref in {"cpu", "none"} or _import_torch() is None:
         return DeviceSpec(kind="cpu", pipeline_device="cpu")
 
+    has_cuda, cuda_count, has_mps = _probe_backends()
+
     # Explicit CUDA device e.g. cuda:1
     if pref.startswith("cuda") or pref.startswith("gpu"):
         index = 0
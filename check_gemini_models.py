@@ -38,10 +38,15 @@ try:
     models = genai.list_models()
     
     generation_models = []
+    first_flash = first_pro = None
     for model in models:
         # Check if model supports generateContent
         if 'generateContent' in model.supported_generation_methods:
             generation_models.append(model.name)
+            if first_flash is None and 'gemini-1.5-flash' in model.name:
+                first_flash = model.name
+            if first_pro is None and 'gemini-pro' in model.name:
+                first_pro = model.name
             print(f"✅ {model.name}")
             print(f"   Display Name: {model.display_name}")
             print(f"   Description: {model.description}")
@@ -60,11 +65,9 @@ try:
         print()
         
         # Recommend which to use
-        if any('gemini-1.5-flash' in m for m in generation_models):
-            recommended = next(m for m in generation_models if 'gemini-1.5-flash' in m)
-            print(f"✨ RECOMMENDED for free tier: {recommended}")
-        elif any('gemini-pro' in m for m in generation_models):
-            recommended = next(m for m in generation_models if 'gemini-pro' in m)
+        # Matches were recorded while listing, so no second pass over the names.
+        recommended = first_flash or first_pro
+        if recommended:
             print(f"✨ RECOMMENDED for free tier: {recommended}")
         else:
             recommended = generation_models[0]
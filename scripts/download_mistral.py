@@ -14,6 +14,7 @@ and click the "Access repository" button.
 
 from __future__ import annotations
 
+import shutil
 import sys
 from pathlib import Path
 
@@ -28,15 +29,14 @@ def main() -> None:
     target_dir.mkdir(parents=True, exist_ok=True)
 
     print(f"Downloading {MODEL_FILENAME} from {MODEL_REPO}...")
-    local_path = hf_hub_download(repo_id=MODEL_REPO, filename=MODEL_FILENAME)
+    # Download straight into models/ rather than the hub cache plus a copy.
+    local_path = hf_hub_download(repo_id=MODEL_REPO, filename=MODEL_FILENAME, local_dir=str(target_dir))
 
     destination = target_dir / MODEL_FILENAME
-    if Path(local_path) == destination:
-        print(f"Model already present at {destination}")
-        return
-
-    print(f"Copying to {destination}")
-    destination.write_bytes(Path(local_path).read_bytes())
+    if Path(local_path).resolve() != destination.resolve():
+        # Older huggingface_hub releases ignore local_dir; copy in-kernel where supported.
+        print(f"Copying to {destination}")
+        shutil.copyfile(local_path, destination)
     print("Download complete.")
 
 
@@ -1,28 +1,69 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import sys
 from pathlib import Path
-from typing import Sequence
+from typing import TYPE_CHECKING, Sequence
 
-import pandas as pd
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    import numpy as np
 
-from ai_judge.utils.evaluation import BinaryEvalResult, evaluate_binary
+    from ai_judge.utils.evaluation import BinaryEvalResult
 
 
-def _load_scores(frame: pd.DataFrame, score_column: str) -> Sequence[float]:
-    if score_column not in frame.columns:
-        raise KeyError(f"Column '{score_column}' not present in file. Available columns: {list(frame.columns)}")
-    return frame[score_column].astype(float).tolist()
+def _require_column(columns: Sequence[str], column: str) -> None:
+    if column not in columns:
+        raise KeyError(f"Column '{column}' not present in file. Available columns: {list(columns)}")
 
 
-def _load_labels(frame: pd.DataFrame, label_column: str) -> Sequence[int]:
-    if label_column not in frame.columns:
-        raise KeyError(
-            f"Column '{label_column}' not present in file. Available columns: {list(frame.columns)}"
+def _read_header(csv_path: Path) -> list[str]:
+    with csv_path.open("r", encoding="utf-8-sig", newline="") as handle:
+        return next(csv.reader(handle), [])
+
+
+def _read_columns(csv_path: Path, score_column: str, label_column: str) -> tuple[np.ndarray, np.ndarray]:
+    """Parse only the score and label columns, with scores straight to float64.
+
+    pyarrow's multi-threaded reader is used when installed, pandas' C engine otherwise.
+    Both are imported here so ``--help`` does not pay for them.
+    """
+    try:  # pragma: no cover - optional dependency
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pacsv  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        pacsv = None
+
+    if pacsv is not None:
+        table = pacsv.read_csv(
+            csv_path,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=[score_column, label_column],
+                column_types={score_column: pa.float64()},
+            ),
+        )
+        return (
+            table.column(score_column).to_numpy(),
+            table.column(label_column).to_numpy(),
         )
-    labels = frame[label_column].astype(int).tolist()
-    if any(label not in (0, 1) for label in labels):
+
+    import pandas as pd
+
+    frame = pd.read_csv(
+        csv_path,
+        usecols=[score_column, label_column],
+        dtype={score_column: "float64"},
+        engine="c",
+    )
+    return frame[score_column].to_numpy(), frame[label_column].to_numpy()
+
+
+def _load_labels(raw: np.ndarray) -> np.ndarray:
+    import numpy as np
+
+    labels = raw.astype(int)
+    if np.any((labels != 0) & (labels != 1)):
         raise ValueError("Ground-truth labels must be 0 or 1")
     return labels
 
@@ -34,9 +75,14 @@ def evaluate_file(
     threshold: float,
     target_tpr: float,
 ) -> BinaryEvalResult:
-    frame = pd.read_csv(csv_path)
-    scores = _load_scores(frame, score_column)
-    labels = _load_labels(frame, label_column)
+    from ai_judge.utils.evaluation import evaluate_binary
+
+    # Check the header first so a missing column still reports every available one.
+    columns = _read_header(csv_path)
+    _require_column(columns, score_column)
+    _require_column(columns, label_column)
+    scores, raw_labels = _read_columns(csv_path, score_column, label_column)
+    labels = _load_labels(raw_labels)
     return evaluate_binary(labels, scores, threshold=threshold, target_tpr=target_tpr)
 
 
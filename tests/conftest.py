@@ -0,0 +1,70 @@
+import io
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from ai_judge.config import Config
+from ai_judge.main import run_pipeline
+
+
+def _create_sample_submission(tmp_path: Path) -> Path:
+    submission_root = tmp_path / "submission"
+    project_root = submission_root / "Student-Management-System-main"
+    nested_code = project_root / "src" / "student_management_system"
+    tests_dir = nested_code / "tests"
+    tests_dir.mkdir(parents=True)
+
+    (project_root / "README.md").write_text(
+        "Student management system with nested source directory.",
+        encoding="utf-8",
+    )
+    (nested_code / "__init__.py").write_text("", encoding="utf-8")
+    (nested_code / "app.py").write_text("print('hello world')\n", encoding="utf-8")
+    (tests_dir / "test_placeholder.py").write_text("def test_placeholder():\n    assert True\n", encoding="utf-8")
+    return submission_root
+
+
+@pytest.fixture(scope="session")
+def sample_submission_zip_bytes(tmp_path_factory: pytest.TempPathFactory) -> bytes:
+    """The sample submission tree, built and zipped in memory once per session."""
+    submission_root = _create_sample_submission(tmp_path_factory.mktemp("proto"))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for path in submission_root.rglob("*"):
+            archive.write(path, path.relative_to(submission_root))
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def zipped_sample_submission(
+    tmp_path_factory: pytest.TempPathFactory, sample_submission_zip_bytes: bytes
+) -> tuple[Config, Path]:
+    """A project tree with the sample submission zipped under data/submissions, built once."""
+    base_dir = tmp_path_factory.mktemp("shared")
+    data_dir = base_dir / "data"
+    submissions_dir = data_dir / "submissions"
+    submissions_dir.mkdir(parents=True)
+    (data_dir / "similarity_corpus").mkdir(parents=True)
+    (base_dir / "reports").mkdir()
+    (base_dir / "models").mkdir()
+
+    zip_path = submissions_dir / "project_zip.zip"
+    zip_path.write_bytes(sample_submission_zip_bytes)
+
+    config = Config(
+        base_dir=base_dir,
+        data_dir=Path("data"),
+        reports_dir=Path("reports"),
+        models_dir=Path("models"),
+        intermediate_dir=Path("intermediate"),
+        similarity_corpus_dir=Path("data") / "similarity_corpus",
+    )
+    return config, zip_path
+
+
+@pytest.fixture(scope="session")
+def warm_pipeline_result(zipped_sample_submission: tuple[Config, Path]) -> tuple[Config, dict]:
+    """The first (cold) pipeline run over the shared submission; later runs hit its caches."""
+    config, _ = zipped_sample_submission
+    return config, run_pipeline(config=config, submission_name="project_zip")
@@ -1,7 +1,12 @@
+import shutil
 from pathlib import Path
 
+import pytest
+
 from ai_judge.modules.video_analyzer import VideoAnalysisResult
-from ai_judge.utils.cache import AnalysisCache
+from ai_judge.utils.cache import AnalysisCache, ResponseCache
+from ai_judge.utils.embedding_cache import CorpusEmbeddingCache
+from ai_judge.utils import fingerprint
 from ai_judge.utils.fingerprint import directory_fingerprint
 
 
@@ -51,3 +56,64 @@ def test_directory_fingerprint_changes_on_update(tmp_path: Path) -> None:
     second = directory_fingerprint(tmp_path)
 
     assert first != second
+
+
+def test_directory_fingerprint_parallel_stat_matches_serial(tmp_path: Path, monkeypatch) -> None:
+    for index in range(40):
+        sub = tmp_path / f"pkg{index % 4}"
+        sub.mkdir(exist_ok=True)
+        (sub / f"module{index}.py").write_text("x" * index, encoding="utf-8")
+    serial = directory_fingerprint(tmp_path)
+
+    monkeypatch.setattr(fingerprint, "_PARALLEL_STAT_THRESHOLD", 1)
+
+    assert directory_fingerprint(tmp_path) == serial
+
+
+def test_corpus_embedding_cache_roundtrip(tmp_path: Path) -> None:
+    np = pytest.importorskip("numpy")
+    cache = CorpusEmbeddingCache(tmp_path, "model-a")
+    matrix = np.eye(3, 4, dtype=np.float16)
+
+    assert cache.load("fp-1") is None
+    cache.store("fp-1", matrix)
+
+    loaded = cache.load("fp-1")
+    assert loaded is not None
+    assert np.array_equal(loaded[0], matrix)
+    assert cache.load("fp-2") is None
+    assert CorpusEmbeddingCache(tmp_path, "model-b").load("fp-1") is None
+
+
+def test_response_cache_roundtrip_and_expiry(tmp_path: Path) -> None:
+    cache = ResponseCache(tmp_path)
+    key = ResponseCache.key("model", "prompt")
+
+    assert cache.get("gemini", key) is None
+    cache.set("gemini", key, "answer")
+    assert cache.get("gemini", key) == "answer"
+    assert cache.get("ddg", key) is None
+    assert key != ResponseCache.key("model", "other prompt")
+
+    assert ResponseCache(tmp_path, ttl_seconds=-1).get("gemini", key) is None
+
+
+def test_analysis_cache_store_after_invalidate(tmp_path: Path) -> None:
+    cache = AnalysisCache(tmp_path)
+    cache.store("alpha", "video", "sig-1", {"value": 1})
+    cache.invalidate("alpha")
+
+    cache.store("alpha", "video", "sig-2", {"value": 2})
+
+    assert cache.load("alpha", "video", "sig-2") == {"value": 2}
+
+
+def test_analysis_cache_store_after_external_delete(tmp_path: Path) -> None:
+    base = tmp_path / "cache"
+    cache = AnalysisCache(base)
+    cache.store("alpha", "video", "sig-1", {"value": 1})
+    shutil.rmtree(base)
+
+    cache.store("alpha", "video", "sig-2", {"value": 2})
+
+    assert cache.load("alpha", "video", "sig-2") == {"value": 2}
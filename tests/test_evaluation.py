@@ -1,3 +1,6 @@
+import random
+
+from ai_judge.utils import evaluation
 from ai_judge.utils.evaluation import evaluate_binary
 
 
@@ -25,3 +28,27 @@ def test_evaluate_binary_handles_no_positives_for_precision() -> None:
     assert result.recall is None
     assert result.f1 is None
     assert result.fpr_at_target_tpr is None
+
+
+def test_vectorized_metrics_match_pure_python(monkeypatch) -> None:
+    rng = random.Random(7)
+    y_true = [rng.randint(0, 1) for _ in range(200)]
+    y_scores = [round(rng.random(), 1) for _ in range(200)]  # plenty of tied scores
+
+    vectorized = evaluate_binary(y_true, y_scores, threshold=0.5, target_tpr=0.8)
+    monkeypatch.setattr(evaluation, "np", None)
+    reference = evaluate_binary(y_true, y_scores, threshold=0.5, target_tpr=0.8)
+
+    assert vectorized == reference
+
+
+def test_numpy_inputs_match_python_sequences() -> None:
+    np = evaluation.np
+    if np is None:
+        return
+    y_true = [1, 0, 1, 0, 1]
+    y_scores = [0.9, 0.4, 0.4, 0.7, 0.2]
+
+    from_arrays = evaluate_binary(np.array(y_true, dtype=np.int8), np.array(y_scores), threshold=0.5)
+
+    assert from_arrays == evaluate_binary(y_true, y_scores, threshold=0.5)
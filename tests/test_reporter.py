@@ -1,14 +1,14 @@
+import csv
 from pathlib import Path
 
-import pandas as pd
+import pytest
 
 from ai_judge.scoring.reporter import ReportGenerator
 
 
-def _sample_payload(tmp_path: Path) -> dict:
+def _build_payload() -> dict:
     return {
         "submission": "alpha",
-        "submission_dir": str(tmp_path / "submissions" / "alpha"),
         "score": {
             "total": 0.876,
             "criteria": {
@@ -104,8 +104,18 @@ def _sample_payload(tmp_path: Path) -> dict:
     }
 
 
-def test_generate_submission_report_creates_rich_html(tmp_path: Path) -> None:
-    payload = _sample_payload(tmp_path)
+@pytest.fixture(scope="module")
+def sample_payload_template() -> dict:
+    """Built once per module; tests shallow-merge their overrides instead of mutating it."""
+    return _build_payload()
+
+
+def _sample_payload(template: dict, tmp_path: Path) -> dict:
+    return {**template, "submission_dir": str(tmp_path / "submissions" / template["submission"])}
+
+
+def test_generate_submission_report_creates_rich_html(tmp_path: Path, sample_payload_template: dict) -> None:
+    payload = _sample_payload(sample_payload_template, tmp_path)
     reporter = ReportGenerator(tmp_path)
 
     report_path = reporter.generate_submission_report("alpha", payload)
@@ -119,13 +129,14 @@ def test_generate_submission_report_creates_rich_html(tmp_path: Path) -> None:
     assert "Pytest output" in html
 
 
-def test_generate_leaderboard_aggregates_dataframe(tmp_path: Path) -> None:
+def test_generate_leaderboard_aggregates_dataframe(tmp_path: Path, sample_payload_template: dict) -> None:
     reporter = ReportGenerator(tmp_path)
+    alpha = _sample_payload(sample_payload_template, tmp_path)
 
     submissions = [
-        _sample_payload(tmp_path),
+        alpha,
         {
-            **_sample_payload(tmp_path),
+            **alpha,
             "submission": "beta",
             "score": {
                 "total": 0.654,
@@ -149,8 +160,9 @@ def test_generate_leaderboard_aggregates_dataframe(tmp_path: Path) -> None:
 
     leaderboard_path = reporter.generate_leaderboard(submissions)
 
-    df = pd.read_csv(leaderboard_path)
-    assert list(df.columns) == [
+    with leaderboard_path.open(encoding="utf-8", newline="") as handle:
+        header, *rows = csv.reader(handle)
+    assert header == [
         "rank",
         "submission",
         "total_score",
@@ -162,6 +174,25 @@ def test_generate_leaderboard_aggregates_dataframe(tmp_path: Path) -> None:
         "code_documentation",
         "code_test_estimate",
     ]
-    assert df.iloc[0]["submission"] == "alpha"
-    assert df.iloc[0]["rank"] == 1
-    assert df.iloc[1]["rank"] == 2
\ No newline at end of file
+    assert [row[:2] for row in rows] == [["1", "alpha"], ["2", "beta"]]
+
+
+def test_unchanged_charts_are_not_redrawn(tmp_path: Path, monkeypatch, sample_payload_template: dict) -> None:
+    payload = _sample_payload(sample_payload_template, tmp_path)
+    ReportGenerator(tmp_path).generate_submission_report("alpha", payload)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("charts should come from the fingerprint manifest")
+
+    monkeypatch.setattr(ReportGenerator, "_plot_scores", fail)
+    reporter = ReportGenerator(tmp_path)
+    charts = reporter._build_charts(
+        "alpha",
+        payload["score"],
+        payload["video_analysis"],
+        payload["text_analysis"],
+        payload["code_analysis"],
+    )
+
+    assert charts
+    assert all((tmp_path / path).is_file() for path in charts.values())
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from ai_judge.modules.code_analyzer import CodeAnalysisResult
@@ -59,3 +61,7 @@ def test_score_combination_uses_weights() -> None:
     weighted_sum = sum(item.weighted_score for item in breakdown.criteria)
     assert breakdown.total == pytest.approx(weighted_sum, rel=1e-6)
     assert 0.0 <= breakdown.total <= 1.0
+
+    serialized = breakdown.as_dict()
+    assert list(serialized["criteria"]) == ["code_quality", "presentation"]
+    json.dumps(serialized)
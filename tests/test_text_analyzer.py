@@ -1,7 +1,12 @@
+import os
 from pathlib import Path
 
+import pytest
+
 from ai_judge.modules.text_analyzer import TextAnalyzer
 
+pytestmark = pytest.mark.xdist_group("analyzers")
+
 
 def test_text_analyzer_similarity_and_claims(tmp_path: Path) -> None:
     corpus_dir = tmp_path / "corpus"
@@ -138,3 +143,143 @@ def test_gemini_priority_over_local_models(tmp_path: Path) -> None:
     # We don't test actual API calls to avoid requiring real keys in tests
     assert isinstance(result_no_key.combined_summary, (str, type(None)))
     assert isinstance(result_with_key.combined_summary, (str, type(None)))
+
+
+def test_corpus_reloads_when_directory_changes(tmp_path: Path) -> None:
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    (corpus_dir / "alpha.txt").write_text("Smart energy automation.", encoding="utf-8")
+
+    analyzer = TextAnalyzer(similarity_corpus_dir=corpus_dir, embedding_model=None)
+    first = analyzer._load_corpus()
+    assert [key for key, _, _ in first] == ["alpha"]
+    assert analyzer._load_corpus() is first
+
+    (corpus_dir / "beta.txt").write_text("Solar powered irrigation.", encoding="utf-8")
+    stamp = corpus_dir.stat().st_mtime_ns + 1_000_000_000
+    os.utime(corpus_dir, ns=(stamp, stamp))
+
+    reloaded = analyzer._load_corpus()
+    assert sorted(key for key, _, _ in reloaded) == ["alpha", "beta"]
+
+
+def test_same_named_corpus_files_keep_their_own_snippets(tmp_path: Path) -> None:
+    corpus_dir = tmp_path / "corpus"
+    for folder, text in (("2023", "Solar powered irrigation."), ("2024", "Smart energy automation.")):
+        (corpus_dir / folder).mkdir(parents=True)
+        (corpus_dir / folder / "winner.txt").write_text(text, encoding="utf-8")
+
+    analyzer = TextAnalyzer(similarity_corpus_dir=corpus_dir, embedding_model=None, top_k=2)
+    matches = analyzer._lexical_similarity(frozenset({"smart", "energy", "solar"}), analyzer._load_corpus())
+
+    snippets = {match.source: match.snippet for match in matches}
+    assert snippets == {
+        "2023/winner": "Solar powered irrigation.",
+        "2024/winner": "Smart energy automation.",
+    }
+
+
+def test_corpus_tokens_come_from_the_byte_prefix(tmp_path: Path) -> None:
+    corpus_dir = tmp_path / "corpus"
+    corpus_dir.mkdir()
+    # "é" straddles the 15-byte cut; "gamma" lies past it.
+    (corpus_dir / "long.txt").write_text("alpha beta cafés " + "x " * 100 + "gamma", encoding="utf-8")
+
+    capped = TextAnalyzer(similarity_corpus_dir=corpus_dir, embedding_model=None, max_corpus_bytes=15)
+    (_, _, tokens), = capped._load_corpus()
+    assert tokens == {"alpha", "beta", "caf"}
+
+    whole = TextAnalyzer(similarity_corpus_dir=corpus_dir, embedding_model=None, max_corpus_bytes=None)
+    (_, _, tokens), = whole._load_corpus()
+    assert {"cafés", "gamma"} <= tokens
+
+
+def test_corpus_embedding_store_is_keyed_on_the_encoder_backend(tmp_path: Path) -> None:
+    analyzer = TextAnalyzer(embedding_model="mini", embedding_cache_dir=tmp_path)
+    sentence_transformer = analyzer._embedding_store().base_dir
+
+    analyzer._embedding_backend = f"onnx:{tmp_path / 'embedder.onnx'}"
+    onnx = analyzer._embedding_store().base_dir
+
+    assert sentence_transformer != onnx
+
+
+def test_parse_batch_verdicts() -> None:
+    analyzer = TextAnalyzer(similarity_corpus_dir=None, embedding_model=None)
+    response = (
+        "Claim 1 Verdict: plausible\n"
+        "Claim 1 Reason: Matches typical benchmarks.\n"
+        "Claim 2 Verdict: Implausible\n"
+        "Claim 2 Reason: No evidence for 100% accuracy.\n"
+        "Claim 3 Verdict: unsure\n"
+    )
+
+    verdicts = analyzer._parse_batch_verdicts(response)
+
+    assert verdicts == {
+        1: ("plausible", "Matches typical benchmarks."),
+        2: ("implausible", "No evidence for 100% accuracy."),
+    }
+
+
+def test_gemini_client_shared_across_instances(monkeypatch) -> None:
+    from ai_judge.modules import text_analyzer
+
+    created = []
+
+    class FakeGenai:
+        @staticmethod
+        def configure(api_key: str) -> None:
+            pass
+
+        @staticmethod
+        def GenerativeModel(model_name: str) -> object:
+            created.append(model_name)
+            return object()
+
+    monkeypatch.setattr(text_analyzer, "genai", FakeGenai)
+    monkeypatch.setattr(TextAnalyzer, "_GEMINI_CLIENTS", {})
+
+    first = TextAnalyzer(embedding_model=None, gemini_api_key="key", gemini_model="m")
+    second = TextAnalyzer(embedding_model=None, gemini_api_key="key", gemini_model="m")
+    other = TextAnalyzer(embedding_model=None, gemini_api_key="other", gemini_model="m")
+
+    assert first._get_gemini_client() is second._get_gemini_client()
+    assert other._get_gemini_client() is not first._get_gemini_client()
+    assert created == ["m", "m"]
+
+
+def test_confident_local_detector_skips_gemini(monkeypatch) -> None:
+    from ai_judge.modules.text_analyzer import _DescStats
+
+    analyzer = TextAnalyzer(embedding_model=None, gemini_api_key="key")
+    gemini_calls = []
+    monkeypatch.setattr(analyzer, "_estimate_ai_with_gemini", lambda text: gemini_calls.append(text) or 0.5)
+    stats = _DescStats.from_text("We built a tool that tracks household energy use.")
+
+    monkeypatch.setattr(analyzer, "_run_ai_detector", lambda text: 0.95)
+    assert analyzer._estimate_ai_generated(stats) == 0.95
+    assert not gemini_calls
+
+    monkeypatch.setattr(analyzer, "_run_ai_detector", lambda text: 0.6)
+    assert analyzer._estimate_ai_generated(stats) == 0.5
+    assert len(gemini_calls) == 1
+
+
+def test_failed_batch_claim_check_falls_back_to_single_claims(monkeypatch) -> None:
+    analyzer = TextAnalyzer(embedding_model=None, gemini_api_key="key")
+    monkeypatch.setattr(analyzer, "_get_gemini_client", lambda: None)
+    prompts = []
+
+    def fake_generate(client, prompt, generation_config):
+        prompts.append(prompt)
+        if len(prompts) == 1:
+            raise RuntimeError("quota exceeded")
+        return "VERDICT: plausible\nREASON: Consistent with the description."
+
+    monkeypatch.setattr(analyzer, "_gemini_generate", fake_generate)
+    claims = [{"statement": "We cut energy use by 40%."}, {"statement": "It runs offline."}]
+    analyzer._enrich_claims_with_gemini("A description.", claims)
+
+    assert len(prompts) == 3
+    assert [claim["llm_verdict"] for claim in claims] == ["plausible", "plausible"]
@@ -1,7 +1,12 @@
+import time
 from pathlib import Path
 
+import pytest
+
 from ai_judge.modules.video_analyzer import VideoAnalyzer
 
+pytestmark = pytest.mark.xdist_group("analyzers")
+
 
 def test_video_analyzer_reads_transcript(tmp_path: Path) -> None:
     transcript = tmp_path / "presentation_transcript.txt"
@@ -47,3 +52,94 @@ def test_video_analyzer_readme_fallback(tmp_path: Path) -> None:
     assert "project overview" in result.transcript.lower()
     assert result.transcription_source == "readme_fallback"
     assert result.sentiment_label in {"positive", "negative", "neutral"}
+
+
+def test_models_are_loaded_once_across_analyzers(monkeypatch) -> None:
+    monkeypatch.setattr(VideoAnalyzer, "_SHARED_MODELS", {})
+    loads = []
+
+    def factory() -> object:
+        loads.append(1)
+        return object()
+
+    first = VideoAnalyzer()._shared_model(("whisper", "base", None), factory)
+    second = VideoAnalyzer()._shared_model(("whisper", "base", None), factory)
+
+    assert first is second
+    assert len(loads) == 1
+
+
+def test_identical_videos_are_transcribed_once(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(VideoAnalyzer, "_SHARED_TRANSCRIPTS", {})
+    monkeypatch.setattr(VideoAnalyzer, "_TRANSCRIPT_LOCKS", {})
+    calls = []
+
+    def fake_transcribe(self, video_path: Path, workers: int = 1):
+        calls.append(video_path)
+        time.sleep(0.05)  # keep the first transcription in flight while the copy is prepared
+        return "Great progress on the demo.", 42.0
+
+    monkeypatch.setattr(VideoAnalyzer, "_transcribe_video", fake_transcribe)
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "presentation.mp4").write_bytes(b"\x00" * 40_000)
+
+    analyzer = VideoAnalyzer()
+    analyzer._can_transcribe = True
+    results = analyzer.analyze_many([tmp_path / "first", tmp_path / "second"])
+
+    assert len(calls) == 1
+    assert [result.transcription_source for result in results] == ["whisper_transcription"] * 2
+    assert results[1].estimated_duration_seconds == 42.0
+
+
+def test_transcript_cache_keys_on_full_content_and_stays_bounded(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(VideoAnalyzer, "_SHARED_TRANSCRIPTS", {})
+    monkeypatch.setattr(VideoAnalyzer, "_TRANSCRIPT_LOCKS", {})
+    monkeypatch.setattr(VideoAnalyzer, "_MAX_SHARED_TRANSCRIPTS", 1)
+    monkeypatch.setattr(VideoAnalyzer, "_transcribe_video", lambda self, path, workers=1: (path.stem, 1.0))
+    # Same size, header and tail; only the middle byte differs.
+    first, second = tmp_path / "first.mp4", tmp_path / "second.mp4"
+    first.write_bytes(b"\x00" * 40_000 + b"a" + b"\x00" * 40_000)
+    second.write_bytes(b"\x00" * 40_000 + b"b" + b"\x00" * 40_000)
+
+    analyzer = VideoAnalyzer()
+    assert analyzer._transcribe_once(first) == ("first", 1.0)
+    assert analyzer._transcribe_once(second) == ("second", 1.0)
+
+    assert len(VideoAnalyzer._SHARED_TRANSCRIPTS) == 1
+    assert VideoAnalyzer._TRANSCRIPT_LOCKS == {}
+
+
+def test_transcription_is_sized_to_the_prepare_pool(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(VideoAnalyzer, "_SHARED_TRANSCRIPTS", {})
+    monkeypatch.setattr(VideoAnalyzer, "_TRANSCRIPT_LOCKS", {})
+    widths = []
+
+    def fake_transcribe(self, video_path: Path, workers: int = 1):
+        widths.append(workers)
+        return video_path.parent.name, 1.0
+
+    monkeypatch.setattr(VideoAnalyzer, "_transcribe_video", fake_transcribe)
+    for name in ("first", "second"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "presentation.mp4").write_bytes(name.encode())
+
+    analyzer = VideoAnalyzer()
+    analyzer._can_transcribe = True
+    analyzer.analyze(tmp_path / "first")
+    monkeypatch.setattr(VideoAnalyzer, "_SHARED_TRANSCRIPTS", {})
+    analyzer.analyze_many([tmp_path / "first", tmp_path / "second"])
+
+    assert widths == [1, 2, 2]
+
+
+def test_classifier_pipeline_returns_top_label_per_text() -> None:
+    class StubClassifier:
+        def predict_batch(self, texts):
+            return [[("NEGATIVE", 0.2), ("POSITIVE", 0.8)] for _ in texts]
+
+    run = VideoAnalyzer._classifier_pipeline(StubClassifier())
+    outputs = run(["a", "b", "c"], batch_size=2)
+
+    assert outputs == [{"label": "POSITIVE", "score": 0.8}] * 3
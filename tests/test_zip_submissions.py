@@ -1,52 +1,18 @@
-import zipfile
 from pathlib import Path
 
+import pytest
+
 from ai_judge.config import Config
 from ai_judge.main import run_pipeline
 
+pytestmark = pytest.mark.xdist_group("pipeline")
 
-def _create_sample_submission(tmp_path: Path) -> Path:
-    submission_root = tmp_path / "submission"
-    project_root = submission_root / "Student-Management-System-main"
-    nested_code = project_root / "src" / "student_management_system"
-    tests_dir = nested_code / "tests"
-    tests_dir.mkdir(parents=True)
-
-    (project_root / "README.md").write_text(
-        "Student management system with nested source directory.",
-        encoding="utf-8",
-    )
-    (nested_code / "__init__.py").write_text("", encoding="utf-8")
-    (nested_code / "app.py").write_text("print('hello world')\n", encoding="utf-8")
-    (tests_dir / "test_placeholder.py").write_text("def test_placeholder():\n    assert True\n", encoding="utf-8")
-    return submission_root
-
-
-def test_run_pipeline_accepts_zipped_submission(tmp_path: Path) -> None:
-    base_dir = tmp_path
-    data_dir = base_dir / "data"
-    submissions_dir = data_dir / "submissions"
-    submissions_dir.mkdir(parents=True)
-    (data_dir / "similarity_corpus").mkdir(parents=True)
-    (base_dir / "reports").mkdir()
-    (base_dir / "models").mkdir()
-
-    submission_root = _create_sample_submission(tmp_path)
-    zip_path = submissions_dir / "project_zip.zip"
-    with zipfile.ZipFile(zip_path, "w") as archive:
-        for path in submission_root.rglob("*"):
-            archive.write(path, path.relative_to(submission_root))
 
-    config = Config(
-        base_dir=base_dir,
-        data_dir=Path("data"),
-        reports_dir=Path("reports"),
-        models_dir=Path("models"),
-        intermediate_dir=Path("intermediate"),
-        similarity_corpus_dir=Path("data") / "similarity_corpus",
-    )
-
-    result = run_pipeline(config=config, submission_name="project_zip")
+def test_run_pipeline_accepts_zipped_submission(
+    zipped_sample_submission: tuple[Config, Path], warm_pipeline_result: tuple[Config, dict]
+) -> None:
+    _, zip_path = zipped_sample_submission
+    config, result = warm_pipeline_result
 
     submission_payload = result["submissions"][0]
 
@@ -77,31 +43,8 @@ def test_run_pipeline_accepts_zipped_submission(tmp_path: Path) -> None:
     assert report_path.exists()
 
 
-def test_run_pipeline_skip_cache_recomputes(tmp_path: Path) -> None:
-    base_dir = tmp_path
-    data_dir = base_dir / "data"
-    submissions_dir = data_dir / "submissions"
-    submissions_dir.mkdir(parents=True)
-    (data_dir / "similarity_corpus").mkdir(parents=True)
-    (base_dir / "reports").mkdir()
-    (base_dir / "models").mkdir()
-
-    submission_root = _create_sample_submission(tmp_path)
-    zip_path = submissions_dir / "project_zip.zip"
-    with zipfile.ZipFile(zip_path, "w") as archive:
-        for path in submission_root.rglob("*"):
-            archive.write(path, path.relative_to(submission_root))
-
-    config = Config(
-        base_dir=base_dir,
-        data_dir=Path("data"),
-        reports_dir=Path("reports"),
-        models_dir=Path("models"),
-        intermediate_dir=Path("intermediate"),
-        similarity_corpus_dir=Path("data") / "similarity_corpus",
-    )
-
-    first = run_pipeline(config=config, submission_name="project_zip")
+def test_run_pipeline_skip_cache_recomputes(warm_pipeline_result: tuple[Config, dict]) -> None:
+    config, first = warm_pipeline_result
     assert first["submissions"]
     second = run_pipeline(config=config, submission_name="project_zip")
     third = run_pipeline(config=config, submission_name="project_zip", skip_cache=True)
@@ -10,16 +10,29 @@ import shutil
 import tempfile
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
-from flask import Flask, render_template, request, jsonify, send_file, url_for
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory, url_for
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import NotFound, RequestEntityTooLarge
+from werkzeug.http import parse_options_header
 from werkzeug.utils import secure_filename
 
 from ai_judge.config import Config
-from ai_judge.main import run_pipeline
+from ai_judge.main import configure_threads, run_pipeline
 from ai_judge.utils.file_helpers import ensure_directory
 
+try:  # pragma: no cover - optional faster JSON codec
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional faster JSON codec
+    orjson = None  # type: ignore
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,60 +40,131 @@ logging.basicConfig(
 )
 LOGGER = logging.getLogger(__name__)
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson; same sorted-key output as the default one."""
+
+    def _options(self) -> int:
+        return orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if self.sort_keys else 0)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self._options()).decode('utf-8')
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default, option=self._options())
+        return self._app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__, template_folder='web_templates', static_folder='web_static')
+if orjson is not None:
+    # jsonify() on /status, uploads and the SSE payloads all serialize through orjson.
+    app.json = OrjsonProvider(app)
 app.config['MAX_CONTENT_LENGTH'] = 500 * 1024 * 1024  # 500MB max file size
 app.config['UPLOAD_FOLDER'] = Path('data/web_uploads')
-app.config['SECRET_KEY'] = os.urandom(24)
+# A fixed key keeps sessions valid across restarts and worker processes; random otherwise.
+app.config['SECRET_KEY'] = os.environ.get('FLASK_SECRET_KEY') or os.urandom(24)
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1MB per readinto() on streamed uploads
+# Resolved once; send_from_directory would otherwise resolve it on every report view.
+REPORTS_DIR = Path('reports').resolve()
+
+# Browsers re-upload the same few names; secure_filename's regex work is pure, so memoize it.
+_secure_filename = lru_cache(maxsize=1024)(secure_filename)
+
+
+_TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
 
 
 @app.template_filter('format_timestamp')
 def format_timestamp(timestamp):
     """Format Unix timestamp to readable date."""
-    from datetime import datetime
-    dt = datetime.fromtimestamp(timestamp)
-    return dt.strftime('%Y-%m-%d %H:%M:%S')
+    return datetime.fromtimestamp(timestamp).strftime(_TIMESTAMP_FORMAT)
+
+
+@dataclass(frozen=True, slots=True)
+class JobState:
+    """Immutable snapshot of one web job's progress."""
+
+    status: str
+    progress: int
+    message: str
+    submission_name: str
+    report_path: str | None = None
+
+
+# Global state for tracking processing jobs. Each entry is a frozen snapshot that is
+# replaced wholesale (a single atomic dict store), so status polls never take a lock
+# and never see a half-applied update; only the job's own worker thread replaces it.
+processing_jobs: Dict[str, JobState] = {}
+MAX_TRACKED_JOBS = 256
+_FINISHED_STATES = frozenset({'completed', 'error'})
+
+# Pipelines run on a bounded pool; uploads beyond MAX_PENDING_JOBS unfinished jobs get a 429.
+JOB_EXECUTOR = ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2), thread_name_prefix='judge')
+MAX_PENDING_JOBS = 32
+# Torch and FAISS thread pools are process-wide: size them once at startup, not per job.
+configure_threads(Config())
+
+
+# Notified on every published snapshot; /events streams wait on it instead of clients polling.
+_job_updates = threading.Condition()
+
+
+def _update_job(job_id: str, **fields: Any) -> None:
+    """Publish a new snapshot of ``job_id`` with ``fields`` applied."""
+    job = processing_jobs.get(job_id)
+    if job is not None:
+        processing_jobs[job_id] = replace(job, **fields)
+        with _job_updates:
+            _job_updates.notify_all()
+
 
-# Global state for tracking processing jobs
-processing_jobs: Dict[str, Dict[str, Any]] = {}
-jobs_lock = threading.Lock()
+def _evict_finished_jobs() -> None:
+    """Forget the oldest finished jobs once more than ``MAX_TRACKED_JOBS`` are tracked.
+
+    Dicts keep insertion order, so the first finished entries are the oldest uploads.
+    Queued and running jobs are never dropped; their worker still publishes to them.
+    """
+    excess = len(processing_jobs) - MAX_TRACKED_JOBS
+    if excess <= 0:
+        return
+    finished = [job_id for job_id, job in list(processing_jobs.items()) if job.status in _FINISHED_STATES]
+    for job_id in finished[:excess]:
+        processing_jobs.pop(job_id, None)
+
+
+def _too_many_pending_jobs() -> bool:
+    pending = sum(1 for job in list(processing_jobs.values()) if job.status not in _FINISHED_STATES)
+    return pending >= MAX_PENDING_JOBS
 
 
 def allowed_file(filename: str) -> bool:
     """Check if the uploaded file is a zip file."""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() == 'zip'
+    return filename.lower().endswith('.zip')
 
 
 def process_submission_async(job_id: str, zip_path: Path, submission_name: str):
     """Process a submission in a background thread."""
     try:
-        with jobs_lock:
-            processing_jobs[job_id]['status'] = 'processing'
-            processing_jobs[job_id]['progress'] = 10
-            processing_jobs[job_id]['message'] = 'Initializing...'
+        _update_job(job_id, status='processing', progress=10, message='Initializing...')
         
-        # Create config
+        # Create config; extraction goes under the job's own upload directory so a
+        # concurrent upload with the same file name cannot clean it up mid-analysis
         config = Config()
         config.gemini_api_key = os.environ.get("GEMINI_API_KEY")
-        
-        # Ensure the submission is in the right location
-        submissions_dir = Path('data/submissions')
-        ensure_directory(submissions_dir)
-        
-        # Copy zip to submissions directory if not already there
-        target_zip = submissions_dir / zip_path.name
-        if not target_zip.exists():
-            shutil.copy2(zip_path, target_zip)
+        config.intermediate_dir = zip_path.parent.resolve()
         
         # Update progress
-        with jobs_lock:
-            if job_id in processing_jobs:
-                processing_jobs[job_id]['progress'] = 20
-                processing_jobs[job_id]['message'] = 'Running analysis pipeline...'
+        _update_job(job_id, progress=20, message='Running analysis pipeline...')
         
-        # Run the pipeline
+        # Run the pipeline straight off the uploaded zip; no copy into data/submissions
         result = run_pipeline(
             config=config,
             submission_name=submission_name,
+            submission_path=zip_path,
         )
         
         # Extract report path from first submission
@@ -88,18 +172,30 @@ def process_submission_async(job_id: str, zip_path: Path, submission_name: str):
         if result.get('submissions') and len(result['submissions']) > 0:
             report_path = result['submissions'][0].get('report_path')
         
-        with jobs_lock:
-            processing_jobs[job_id]['status'] = 'completed'
-            processing_jobs[job_id]['progress'] = 100
-            processing_jobs[job_id]['message'] = 'Processing complete!'
-            processing_jobs[job_id]['report_path'] = str(report_path) if report_path else None
-            processing_jobs[job_id]['submission_name'] = submission_name
+        _update_job(
+            job_id,
+            status='completed',
+            progress=100,
+            message='Processing complete!',
+            report_path=str(report_path) if report_path else None,
+            submission_name=submission_name,
+        )
             
     except Exception as e:
         LOGGER.error(f"Error processing submission {job_id}: {e}", exc_info=True)
-        with jobs_lock:
-            processing_jobs[job_id]['status'] = 'error'
-            processing_jobs[job_id]['message'] = f'Error: {str(e)}'
+        _update_job(job_id, status='error', message=f'Error: {str(e)}')
+    finally:
+        # The zip and its extraction are only needed while the pipeline runs
+        shutil.rmtree(zip_path.parent, ignore_errors=True)
+
+
+@app.before_request
+def reject_oversized_body():
+    """Answer 413 from the declared Content-Length, before any of the body is read."""
+    limit = app.config['MAX_CONTENT_LENGTH']
+    if limit is not None and request.content_length is not None and request.content_length > limit:
+        return jsonify({'error': 'File too large'}), 413
+    return None
 
 
 @app.route('/')
@@ -108,6 +204,34 @@ def index():
     return render_template('index.html')
 
 
+def _new_job_dir() -> tuple[str, Path]:
+    """Allocate a job id and the private upload directory its zip is saved into."""
+    # Opaque, fixed-length and collision-free, unlike "<second>_<filename>"; also keeps
+    # the uploaded file name out of status URLs and access logs.
+    job_id = uuid.uuid4().hex
+    return job_id, ensure_directory(app.config['UPLOAD_FOLDER'] / job_id)
+
+
+def _start_job(job_id: str, filename: str, zip_path: Path):
+    """Register a processing job for an uploaded zip and start it in the background."""
+    submission_name, _ = os.path.splitext(filename)
+    processing_jobs[job_id] = JobState(
+        status='queued',
+        progress=0,
+        message='Upload complete, queued for processing...',
+        submission_name=submission_name,
+    )
+    _evict_finished_jobs()
+
+    # Queue processing on the shared worker pool
+    JOB_EXECUTOR.submit(process_submission_async, job_id, zip_path, submission_name)
+
+    return jsonify({
+        'job_id': job_id,
+        'message': 'Upload successful, processing started',
+    })
+
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
     """Handle file upload and start processing."""
@@ -120,41 +244,73 @@ def upload_file():
     
     if not allowed_file(file.filename):
         return jsonify({'error': 'Only ZIP files are allowed'}), 400
+
+    if _too_many_pending_jobs():
+        return jsonify({'error': 'Too many submissions in progress, try again shortly'}), 429
     
+    job_dir = None
     try:
-        # Create upload directory if it doesn't exist
-        app.config['UPLOAD_FOLDER'].mkdir(parents=True, exist_ok=True)
-        
-        # Save the uploaded file
-        filename = secure_filename(file.filename)
-        job_id = f"{int(time.time())}_{filename}"
-        zip_path = app.config['UPLOAD_FOLDER'] / filename
+        # Save the uploaded file into a directory of its own
+        job_id, job_dir = _new_job_dir()
+        filename = _secure_filename(file.filename)
+        zip_path = job_dir / filename
         file.save(zip_path)
         
-        # Initialize job tracking
-        submission_name = filename.rsplit('.', 1)[0]
-        with jobs_lock:
-            processing_jobs[job_id] = {
-                'status': 'queued',
-                'progress': 0,
-                'message': 'Upload complete, queued for processing...',
-                'submission_name': submission_name,
-            }
-        
-        # Start processing in background thread
-        thread = threading.Thread(
-            target=process_submission_async,
-            args=(job_id, zip_path, submission_name),
-            daemon=True
-        )
-        thread.start()
-        
-        return jsonify({
-            'job_id': job_id,
-            'message': 'Upload successful, processing started',
-        })
+        return _start_job(job_id, filename, zip_path)
         
     except Exception as e:
+        if job_dir is not None:
+            shutil.rmtree(job_dir, ignore_errors=True)
+        LOGGER.error(f"Upload error: {e}", exc_info=True)
+        return jsonify({'error': str(e)}), 500
+
+
+@app.route('/upload_stream', methods=['POST'])
+def upload_stream():
+    """Handle a raw (non-multipart) zip upload, streamed straight to disk.
+
+    The file name comes from the ``Content-Disposition`` header. The body is
+    copied in 1MB ``readinto`` chunks, skipping Werkzeug's multipart parser and
+    its spooled temporary file.
+    """
+    _, options = parse_options_header(request.headers.get('Content-Disposition', ''))
+    raw_name = options.get('filename', '')
+    if not raw_name:
+        return jsonify({'error': 'No file provided'}), 400
+
+    if not allowed_file(raw_name):
+        return jsonify({'error': 'Only ZIP files are allowed'}), 400
+
+    if _too_many_pending_jobs():
+        return jsonify({'error': 'Too many submissions in progress, try again shortly'}), 429
+
+    limit = app.config['MAX_CONTENT_LENGTH']
+    filename = _secure_filename(raw_name)
+    job_id, job_dir = _new_job_dir()
+    zip_path = job_dir / filename
+    try:
+        received = 0
+        buffer = memoryview(bytearray(UPLOAD_CHUNK_SIZE))
+        with zip_path.open('wb') as handle:
+            while True:
+                count = request.stream.readinto(buffer)
+                if not count:
+                    break
+                received += count
+                if limit is not None and received > limit:
+                    raise RequestEntityTooLarge()
+                handle.write(buffer[:count])
+        if not received:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            return jsonify({'error': 'No file selected'}), 400
+
+        return _start_job(job_id, filename, zip_path)
+
+    except RequestEntityTooLarge:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        return jsonify({'error': 'File too large'}), 413
+    except Exception as e:
+        shutil.rmtree(job_dir, ignore_errors=True)
         LOGGER.error(f"Upload error: {e}", exc_info=True)
         return jsonify({'error': str(e)}), 500
 
@@ -162,46 +318,130 @@ def upload_file():
 @app.route('/status/<job_id>')
 def check_status(job_id: str):
     """Check the processing status of a job."""
-    with jobs_lock:
-        if job_id not in processing_jobs:
-            return jsonify({'error': 'Job not found'}), 404
-        
-        job = processing_jobs[job_id]
-        return jsonify({
-            'status': job['status'],
-            'progress': job['progress'],
-            'message': job['message'],
-            'report_path': job.get('report_path'),
-            'submission_name': job.get('submission_name'),
-        })
+    job = processing_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+
+    return jsonify(_status_payload(job))
+
+
+def _status_payload(job: JobState) -> Dict[str, Any]:
+    return {
+        'status': job.status,
+        'progress': job.progress,
+        'message': job.message,
+        'report_path': job.report_path,
+        'submission_name': job.submission_name,
+    }
+
+
+SSE_KEEPALIVE_SECONDS = 15
+# Each open stream pins a server thread, so streams are short-lived (the browser reconnects
+# after SSE_RETRY_MS) and at most MAX_SSE_STREAMS run at once, leaving the rest of the
+# 16-thread pool for uploads, status polls and reports; refused clients fall back to polling.
+SSE_MAX_STREAM_SECONDS = 60
+SSE_RETRY_MS = 1000
+MAX_SSE_STREAMS = 8
+_sse_slots = threading.BoundedSemaphore(MAX_SSE_STREAMS)
+
+
+def _job_events(job_id: str):
+    """Yield one SSE message per published snapshot until the job finishes.
+
+    Streams end after ``SSE_MAX_STREAM_SECONDS``; the browser then reconnects and
+    receives the current snapshot first.
+    """
+    yield f"retry: {SSE_RETRY_MS}\n\n"
+    deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+    last = None
+    while time.monotonic() < deadline:
+        with _job_updates:
+            # Snapshots are replaced, never mutated, so identity tells us something changed.
+            _job_updates.wait_for(
+                lambda: processing_jobs.get(job_id) is not last, timeout=SSE_KEEPALIVE_SECONDS
+            )
+        job = processing_jobs.get(job_id)
+        if job is None:
+            yield "event: gone\ndata: {}\n\n"
+            return
+        if job is last:
+            yield ": keep-alive\n\n"
+            continue
+        last = job
+        yield f"data: {app.json.dumps(_status_payload(job))}\n\n"
+        if job.status in _FINISHED_STATES:
+            return
+
+
+@app.route('/events/<job_id>')
+def job_events(job_id: str):
+    """Push status updates for a job as Server-Sent Events."""
+    if job_id not in processing_jobs:
+        return jsonify({'error': 'Job not found'}), 404
+    if not _sse_slots.acquire(blocking=False):
+        return jsonify({'error': 'Too many open event streams, poll /status instead'}), 503
+    response = Response(
+        _job_events(job_id),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+    # Runs when the server closes the response, including after a client disconnect.
+    response.call_on_close(_sse_slots.release)
+    return response
 
 
 @app.route('/report/<path:filename>')
 def view_report(filename: str):
-    """Serve the generated HTML report."""
-    report_path = Path('reports') / filename
-    if not report_path.exists():
+    """Serve the generated HTML report (and the chart images it links to).
+
+    ``send_from_directory`` rejects paths escaping ``reports/``, answers repeat
+    views with 304 via ETag/Last-Modified, and hands the body to the server's
+    ``wsgi.file_wrapper`` (sendfile under waitress/gunicorn).
+    """
+    try:
+        return send_from_directory(REPORTS_DIR, filename, conditional=True, etag=True)
+    except NotFound:
         return "Report not found", 404
-    
-    return send_file(report_path, mimetype='text/html')
+
+
+# (directory mtime_ns, sorted report list) from the last scan of the reports folder.
+_reports_cache: Dict[str, Any] = {'snapshot': None}
+
+
+def _scan_reports(reports_dir: Path) -> list[Dict[str, Any]]:
+    reports = []
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith('_report.html') and entry.is_file():
+                reports.append({
+                    'name': entry.name[:-len('_report.html')],
+                    'filename': entry.name,
+                    'modified': entry.stat().st_mtime,
+                })
+    reports.sort(key=lambda x: x['modified'], reverse=True)
+    return reports
 
 
 @app.route('/reports')
 def list_reports():
     """List all available reports."""
     reports_dir = Path('reports')
-    if not reports_dir.exists():
+    try:
+        dir_stat = reports_dir.stat()
+    except FileNotFoundError:
         return render_template('reports_list.html', reports=[])
-    
-    reports = []
-    for report_file in reports_dir.glob('*_report.html'):
-        reports.append({
-            'name': report_file.stem.replace('_report', ''),
-            'filename': report_file.name,
-            'modified': report_file.stat().st_mtime,
-        })
-    
-    reports.sort(key=lambda x: x['modified'], reverse=True)
+
+    # Reports are written to a temp file and renamed into place, so every new or
+    # regenerated report bumps the directory mtime and invalidates this listing.
+    snapshot = _reports_cache['snapshot']
+    if snapshot is not None and snapshot[0] == dir_stat.st_mtime_ns:
+        return render_template('reports_list.html', reports=snapshot[1])
+
+    reports = _scan_reports(reports_dir)
+    # Timestamps are coarse, so a rename in the same tick as this scan would keep the
+    # mtime; only remember listings of a directory that has been quiet for a second.
+    if time.time() - dir_stat.st_mtime >= 1.0:
+        _reports_cache['snapshot'] = (dir_stat.st_mtime_ns, reports)
     return render_template('reports_list.html', reports=reports)
 
 
@@ -218,4 +458,20 @@ if __name__ == '__main__':
     print(f"🌐 Starting server at: http://localhost:5000")
     print("="*60 + "\n")
     
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    try:
+        from waitress import serve  # type: ignore
+    except ImportError:  # pragma: no cover - optional dependency
+        serve = None
+
+    if serve is not None:
+        # Thread pool: status polls keep being answered while large uploads stream in.
+        # waitress buffers request bodies itself, so enforce the size cap at that layer too.
+        serve(
+            app,
+            host='0.0.0.0',
+            port=5000,
+            threads=16,
+            max_request_body_size=app.config['MAX_CONTENT_LENGTH'],
+        )
+    else:
+        app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=5000, threaded=True)